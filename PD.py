@@ -16,15 +16,20 @@ Flow:
 7. Append N new months to Portfolio_2
 8. Refresh pivot table and save
 """
+import logging
 import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
 # Add the Class directory to the path
 class_path = os.path.join(os.path.dirname(__file__), 'Scripts', 'Class')
 sys.path.insert(0, class_path)
 
 from BasicExcelFunctionsClass import ExcelPortfolioAutomation
+import numpy as np
 import pandas as pd
 
 
@@ -60,18 +65,25 @@ COLUMN_POSITIONS = {
     'DPD': 'F'
 }
 
+# Span of the Portfolio sheets that holds the columns above (the rest is formulas)
+PORTFOLIO_READ_COLUMNS = 'A:F'
+
+# Excel runs hidden unless this flag is passed on the command line
+VISIBLE_FLAG = '--visible'
+
 
 # =============================================================================
 # USER INPUT FUNCTION (Remains in Main.py as it's specific to this script)
 # =============================================================================
 def get_end_month_from_args() -> datetime:
     """Get the new end month from command line argument."""
-    if len(sys.argv) < 2:
-        print("\nUsage: python Main.py MM/DD/YYYY")
-        print("Example: python Main.py 09/30/2025")
+    args = [arg for arg in sys.argv[1:] if arg != VISIBLE_FLAG]
+    if not args:
+        print("\nUsage: python PD.py MM/DD/YYYY [--visible]")
+        print("Example: python PD.py 09/30/2025")
         sys.exit(1)
 
-    date_str = sys.argv[1].strip()
+    date_str = args[0].strip()
     try:
         return ExcelPortfolioAutomation.parse_month_string(date_str)
     except ValueError:
@@ -80,13 +92,19 @@ def get_end_month_from_args() -> datetime:
         sys.exit(1)
 
 
+def show_excel_from_args() -> bool:
+    """Whether Excel should be shown while running (--visible flag)."""
+    return VISIBLE_FLAG in sys.argv[1:]
+
+
 # =============================================================================
 # MAIN AUTOMATION - PART 1: PORTFOLIO ROLL-FORWARD
 # =============================================================================
 def run_automation():
     """Main automation workflow - Portfolio Roll-Forward."""
 
-    os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+    output_dir = Path(OUTPUT_FOLDER)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
     print("\n" + "="*80)
     print("PD PORTFOLIO ROLL-FORWARD AUTOMATION")
@@ -139,26 +157,6 @@ def run_automation():
         print("\nERROR: No summary files found.")
         return False, None
 
-    print(f"\nExtracting data...")
-    new_data = ExcelPortfolioAutomation.extract_data_from_summary_files(
-        file_paths=summary_files,
-        column_mapping=COLUMN_MAPPING,
-        output_columns=DF_TO_PORTFOLIO_COLUMNS,
-        sheet_name='SUMMARY',
-        date_format='%m/%d/%Y'
-    )
-
-    if new_data.empty:
-        print("\nERROR: No data extracted.")
-        return False, None
-
-    print(f"\nNew data: {len(new_data)} rows")
-
-    # Step 5-7: Open Excel and perform roll-forward
-    print("\n" + "-"*60)
-    print("PERFORMING ROLL-FORWARD")
-    print("-"*60)
-
     # Get the latest PD file (output file if exists, otherwise original)
     pd_file = ExcelPortfolioAutomation.get_latest_file_in_folder(
         folder_path=OUTPUT_FOLDER,
@@ -166,24 +164,76 @@ def run_automation():
         fallback_file=ORIGINAL_PD_FILE
     )
 
-    output_file = None
+    # The current portfolios are read straight from the saved PD file (Excel is only
+    # needed for the writes). Those reads are independent of the summary files, so
+    # they run in background processes while the summaries are extracted
+    with ProcessPoolExecutor(max_workers=2) as portfolio_pool:
+        portfolio_reads = [portfolio_pool.submit(ExcelPortfolioAutomation.read_portfolio_data_from_file,
+                                                 pd_file, sheet_name, usecols=PORTFOLIO_READ_COLUMNS)
+                           for sheet_name in ('Portfolio_1', 'Portfolio_2')]
+
+        print(f"\nExtracting data...")
+        new_data = ExcelPortfolioAutomation.extract_data_from_summary_files(
+            file_paths=summary_files,
+            column_mapping=COLUMN_MAPPING,
+            output_columns=DF_TO_PORTFOLIO_COLUMNS,
+            sheet_name='SUMMARY',
+            date_format='%m/%d/%Y'
+        )
+
+        if new_data.empty:
+            print("\nERROR: No data extracted.")
+            for future in portfolio_reads:
+                future.cancel()
+            return False, None
 
-    with ExcelPortfolioAutomation(pd_file, visible=True) as excel:
+        print(f"\nNew data: {len(new_data)} rows")
+
+        # Step 5-7: Open Excel and perform roll-forward
+        print("\n" + "-"*60)
+        print("PERFORMING ROLL-FORWARD")
+        print("-"*60)
 
-        # Read current portfolios using the new instance method
         print("\nReading current portfolios...")
-        p1_data = excel.read_portfolio_data('Portfolio_1')
-        p2_data = excel.read_portfolio_data('Portfolio_2')
+        try:
+            p1_data, p2_data = (future.result() for future in portfolio_reads)
+        except Exception as e:
+            print(f"  Warning: could not read portfolios from file ({e}), reading through Excel")
+            p1_data = p2_data = None
+
+    output_file = None
+
+    with ExcelPortfolioAutomation(pd_file, visible=show_excel_from_args()) as excel:
+
+        if p1_data is None:
+            # Fall back to reading through the open workbook
+            p1_data = excel.read_portfolio_data('Portfolio_1', usecols=PORTFOLIO_READ_COLUMNS)
+            p2_data = excel.read_portfolio_data('Portfolio_2', usecols=PORTFOLIO_READ_COLUMNS)
 
-        p1_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(p1_data)
-        p2_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(p2_data)
+        # Parse MONTH once per source; the parsed values feed the month lists,
+        # the month-window trim and the sorts below
+        source_months = {}
+        for name, source in (('p1', p1_data), ('p2', p2_data), ('new', new_data)):
+            if not source.empty:
+                source_months[name] = pd.to_datetime(source['MONTH'], format='%m/%d/%Y',
+                                                      errors='coerce', cache=True)
+
+        p1_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(
+            p1_data, month_dates=source_months.get('p1'))
+        p2_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(
+            p2_data, month_dates=source_months.get('p2'))
 
         print(f"  Portfolio_1: {len(p1_months)} months, {len(p1_data)} rows")
         print(f"  Portfolio_2: {len(p2_months)} months, {len(p2_data)} rows")
 
         # Calculate new month distributions
-        new_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(new_data)
-        all_months = sorted(set(p1_months + p2_months + new_months))
+        new_months = ExcelPortfolioAutomation.get_unique_months_from_dataframe(
+            new_data, month_dates=source_months['new'])
+        # Merge the three sorted month lists as datetime64 arrays (union1d sorts and
+        # de-duplicates in numpy) rather than hashing datetimes through a set
+        all_months = np.union1d(np.union1d(np.array(p1_months, dtype='datetime64[ns]'),
+                                           np.array(p2_months, dtype='datetime64[ns]')),
+                                np.array(new_months, dtype='datetime64[ns]'))
 
         # Keep only latest 13 months total
         if len(all_months) > TOTAL_MONTHS:
@@ -198,39 +248,77 @@ def run_automation():
         print(f"  Portfolio_2: {len(new_p2_months)} months")
         print(f"  Total: {len(new_p1_months) + len(new_p2_months)} months")
 
-        # Combine all data
-        all_data = pd.concat([p1_data, p2_data, new_data], ignore_index=True)
-
-        # Remove duplicates (keep latest)
-        all_data = all_data.drop_duplicates(subset=['MONTH', 'CONTRACT_NO'], keep='last')
-
-        # Split data by new month distributions using static method
-        new_p1_data = ExcelPortfolioAutomation.filter_dataframe_by_months(all_data, new_p1_months)
-        new_p2_data = ExcelPortfolioAutomation.filter_dataframe_by_months(all_data, new_p2_months)
-
-        # Sort by month
-        new_p1_data = new_p1_data.sort_values('MONTH', key=lambda x: pd.to_datetime(x, format='%m/%d/%Y'))
-        new_p2_data = new_p2_data.sort_values('MONTH', key=lambda x: pd.to_datetime(x, format='%m/%d/%Y'))
-
-        # Write to portfolios using the new instance method
+        # Drop rows outside the 13-month window before the dedup/concat, so only
+        # rows that can still be written get combined. The parsed month column
+        # drives both splits and is carried through for sorting.
+        windowed_sources = []
+        for name, source in (('p1', p1_data), ('p2', p2_data), ('new', new_data)):
+            if name not in source_months:
+                continue
+            month_dates = source_months[name]
+            in_window = month_dates.isin(all_months)
+            windowed_sources.append(source.loc[in_window].assign(_M=month_dates[in_window]))
+
+        # Combine all data, removing duplicates (keep latest) before the concat
+        all_data = ExcelPortfolioAutomation.concat_keep_latest(
+            windowed_sources, subset=['MONTH', 'CONTRACT_NO'],
+            columns=DF_TO_PORTFOLIO_COLUMNS + ['_M'])
+
+        # The window holds at most 13 distinct months, so the parsed key is stored as an
+        # ordered category: the isin/sort work then runs on small integer codes. (MONTH
+        # itself keeps its raw values, which mix Excel dates from the portfolios with
+        # summary-file strings.)
+        month_dtype = pd.CategoricalDtype(pd.DatetimeIndex(all_months), ordered=True)
+        all_data['_M'] = all_data['_M'].astype(month_dtype)
+
+        # Sort once by month (stable, so rows keep their order within a month), then
+        # split: each portfolio slice comes out already in month order. The category
+        # code of _M is the month's position in all_months, so the splits are plain
+        # integer comparisons (Portfolio_1 = first months, Portfolio_2 = last months)
+        all_data = all_data.sort_values('_M', kind='mergesort')
+        month_codes = all_data['_M'].cat.codes.to_numpy()
+        p1_mask = (month_codes >= 0) & (month_codes < len(new_p1_months))
+        p2_mask = month_codes >= len(all_months) - len(new_p2_months)
+        # Write MONTH in one canonical form: the parsed dates, rather than the raw mix of
+        # Excel datetimes and summary-file strings (one typed column for the COM write).
+        # This only normalises the format; concat_keep_latest already keeps the raw
+        # values intact, so nothing here depends on it to repair them
+        all_data['MONTH'] = all_data['_M'].astype('datetime64[ns]')
+        all_data = all_data.drop(columns='_M')
+        new_p1_data = all_data.loc[p1_mask]
+        new_p2_data = all_data.loc[p2_mask]
+
+        # Write to portfolios and refresh the pivot in one suspended block: the
+        # clears and writes no longer recalculate the formula columns cell by cell.
+        # One explicit recalculation runs before the pivot reads them.
         print("\nWriting portfolios...")
-        excel.write_portfolio_data('Portfolio_1', new_p1_data, DF_TO_PORTFOLIO_COLUMNS, COLUMN_POSITIONS)
-        excel.write_portfolio_data('Portfolio_2', new_p2_data, DF_TO_PORTFOLIO_COLUMNS, COLUMN_POSITIONS)
-
-        # Refresh pivot table
-        print("\nRefreshing pivot table...")
-        try:
-            excel.refresh_pivot_table('01.Pivoted_Portfolio', 'PivotTable1')
-            print("  Pivot table refreshed!")
-        except Exception as e:
-            print(f"  Warning: {e}")
+        with excel.suspend_excel_updates():
+            excel.write_portfolio_data('Portfolio_1', new_p1_data, DF_TO_PORTFOLIO_COLUMNS, COLUMN_POSITIONS)
+            excel.write_portfolio_data('Portfolio_2', new_p2_data, DF_TO_PORTFOLIO_COLUMNS, COLUMN_POSITIONS)
+            excel.calculate()
+
+            # Refresh pivot table
+            print("\nRefreshing pivot table...")
+            try:
+                excel.refresh_pivot_table('01.Pivoted_Portfolio', 'PivotTable1')
+                print("  Pivot table refreshed!")
+            except Exception as e:
+                print(f"  Warning: {e}")
 
         # Save
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = os.path.join(OUTPUT_FOLDER, f"01. PD_data_2024-25_Updated_{timestamp}.xlsb")
+        output_file = str(output_dir / f"01. PD_data_2024-25_Updated_{timestamp}.xlsb")
         excel.save_as(output_file)
         print(f"\nSaved: {output_file}")
 
+        # Hand the refreshed pivot to Part 2 as a Parquet sidecar, so it does not
+        # have to reopen this workbook just to read the pivot back
+        try:
+            pivot_df = excel.extract_pivot_table_to_dataframe('01.Pivoted_Portfolio')
+            ExcelPortfolioAutomation.save_pivot_sidecar(pivot_df, output_file)
+        except Exception as e:
+            print(f"  Warning: could not save pivot sidecar ({e})")
+
     # Update config using static method
     ExcelPortfolioAutomation.save_config_file(CONFIG_FILE, new_end_month)
 
@@ -262,7 +350,8 @@ def run_historic_update(latest_pd_file: str):
             output_folder=OUTPUT_FOLDER,
             historic_filename="02. Historic PD Calculation 2024-25.xlsb",
             pivot_sheet="01.Pivoted_Portfolio",
-            historic_sheet="02.Working"
+            historic_sheet="02.Working",
+            visible=show_excel_from_args()
         )
         
         if historic_output_file:
@@ -274,7 +363,6 @@ def run_historic_update(latest_pd_file: str):
             
     except Exception as e:
         print(f"\n❌ ERROR in Historic PD update: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -283,6 +371,9 @@ def run_historic_update(latest_pd_file: str):
 # ENTRY POINT
 # =============================================================================
 if __name__ == "__main__":
+    # Show the library's progress messages; raise to WARNING to keep only warnings and errors
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     try:
         print("\n" + "█"*80)
         print("█" + " "*78 + "█")
@@ -335,7 +426,6 @@ if __name__ == "__main__":
         print("\n" + "="*80)
         print(f"❌ FATAL ERROR: {e}")
         print("="*80)
-        import traceback
         traceback.print_exc()
         sys.exit(1)
         
\ No newline at end of file
@@ -8,15 +8,62 @@ Automates the process of:
 5. Reading xlsx file and pasting first 5 columns to 1.DPD sheet starting at A2
 6. Saving as "Updated ECL Portfolio" in xlsb format
 """
+import numpy as np
 import pandas as pd
 import xlwings as xw
 from datetime import datetime
 import os
 import glob
+import fnmatch
 import shutil
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Tuple, List
 import re
 import calendar
+import csv
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+# All progress messages go through logging, so the caller decides whether they
+# are shown (PD.py sends INFO to stdout), silenced or buffered
+logger = logging.getLogger(__name__)
+
+# Prefer the Rust-backed calamine reader for closed .xlsb files (pandas >= 2.2),
+# falling back to pyxlsb when python-calamine is not installed
+try:
+    from python_calamine import CalamineWorkbook
+    XLSB_READ_ENGINE = 'calamine'
+except ImportError:
+    CalamineWorkbook = None
+    XLSB_READ_ENGINE = 'pyxlsb'
+
+# Arrow-backed strings are contiguous buffers with vectorized kernels; fall back
+# to pandas' own string dtype when pyarrow is not installed
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+    DTYPE_BACKEND = 'pyarrow'
+except ImportError:
+    STRING_DTYPE = 'string'
+    DTYPE_BACKEND = None
+
+# Cell values treated as empty when filtering summary rows and pivot output
+EMPTY_SUMMARY_VALUES = ('', '-', 'nan', 'None')
+PIVOT_ARTIFACT_VALUES = ('(blank)', 'blank', '', 'Grand Total')
+
+# A1-style cell address: column letters followed by an optional row number
+CELL_ADDRESS_PATTERN = re.compile(r'\$?([A-Za-z]+)\$?(\d*)')
+
+# Integer codes Range.Value2 returns for error cells (#NULL!, #DIV/0!, #VALUE!,
+# #REF!, #NAME?, #NUM!, #N/A)
+EXCEL_ERROR_CODES = (-2146826288, -2146826281, -2146826273, -2146826265,
+                     -2146826259, -2146826252, -2146826246)
+
+# Rows per Value2 assignment; larger blocks make Excel allocate one huge
+# SAFEARRAY and can fail with out-of-memory COM errors
+WRITE_CHUNK_ROWS = 50000
 
 
 class ExcelPortfolioAutomation:
@@ -24,18 +71,33 @@ class ExcelPortfolioAutomation:
     Excel Portfolio Automation class using xlwings for .xlsb file manipulation
     """
 
-    def __init__(self, workbook_path: str, visible: bool = True):
+    def __init__(self, workbook_path: str, visible: bool = False, read_only: bool = False,
+                 update_links: bool = None, app: xw.App = None):
         """
         Initialize the automation class
 
         Args:
             workbook_path: Path to the .xlsb Excel file
             visible: Whether to show Excel application (default: False)
+            read_only: Open the workbook read-only, skipping the lock file and
+                       write-access setup when the workbook is only read (default: False)
+            update_links: Whether Excel should update external links on open.
+                          None keeps Excel's own setting (default: None)
+            app: Running xw.App to open the workbook in. The caller keeps ownership
+                 and quits it; None starts (and later quits) a new instance (default: None)
         """
         self.workbook_path = workbook_path
         self.visible = visible
-        self.app = None
+        self.read_only = read_only
+        self.update_links = update_links
+        self.app = app
+        self._owns_app = app is None
         self.workbook = None
+        self._suspend_depth = 0
+        # Calculation mode to restore when the outermost suspended block exits
+        self._suspended_calculation = None
+        # xlwings Sheet objects by name, so each sheet is looked up through COM once
+        self._sheet_cache = {}
 
     def __enter__(self):
         """Context manager entry - opens the workbook"""
@@ -48,10 +110,14 @@ class ExcelPortfolioAutomation:
 
     def open_workbook(self):
         """Open the Excel workbook"""
-        print(f"Opening workbook: {self.workbook_path}")
-        self.app = xw.App(visible=self.visible)
-        self.workbook = self.app.books.open(self.workbook_path)
-        print(f"    Workbook opened successfully")
+        logger.info(f"Opening workbook: {self.workbook_path}")
+        if self.app is None:
+            self.app = xw.App(visible=self.visible)
+        self.workbook = self.app.books.open(self.workbook_path,
+                                            update_links=self.update_links,
+                                            read_only=self.read_only,
+                                            ignore_read_only_recommended=True)
+        logger.info(f"    Workbook opened successfully{' (read-only)' if self.read_only else ''}")
 
     def close_workbook(self, save: bool = False):
         """
@@ -63,12 +129,66 @@ class ExcelPortfolioAutomation:
         if self.workbook:
             if save:
                 self.workbook.save()
-                print(f"    Workbook saved")
+                logger.info(f"    Workbook saved")
             self.workbook.close()
-            print(f"    Workbook closed")
-        if self.app:
+            self._sheet_cache.clear()
+            logger.info(f"    Workbook closed")
+        if self.app and self._owns_app:
             self.app.quit()
 
+    @contextmanager
+    def suspend_excel_updates(self):
+        """
+        Context manager that disables screen updating, automatic calculation,
+        alerts and events for the duration of a bulk operation, restoring the
+        original settings on exit. Nested blocks are no-ops, so the outer
+        block decides when Excel recalculates. Every writer of this class runs
+        in such a block; wrap a sequence of calls to recalculate only once.
+
+        Usage:
+            with excel.suspend_excel_updates():
+                excel.write_portfolio_data(...)
+        """
+        self._suspend_depth += 1
+        if self._suspend_depth > 1:
+            try:
+                yield
+            finally:
+                self._suspend_depth -= 1
+            return
+
+        logger.debug(f"   Disabling screen updating and auto-calculation...")
+        original_screen_updating = self.app.screen_updating
+        original_calculation = self.app.api.Calculation
+        self._suspended_calculation = original_calculation
+        original_display_alerts = self.app.api.DisplayAlerts
+        original_enable_events = self.app.api.EnableEvents
+
+        self.app.screen_updating = False
+        self.app.api.Calculation = -4135  # xlCalculationManual
+        self.app.api.DisplayAlerts = False
+        self.app.api.EnableEvents = False
+
+        try:
+            yield
+        finally:
+            self._suspend_depth -= 1
+            self._suspended_calculation = None
+            # Re-enable screen updating, auto-calculation, alerts, and events
+            logger.debug(f"   Re-enabling screen updating and auto-calculation...")
+            self.app.api.EnableEvents = original_enable_events
+            self.app.api.DisplayAlerts = original_display_alerts
+            self.app.api.Calculation = original_calculation
+            self.app.screen_updating = original_screen_updating
+
+    def calculate(self) -> None:
+        """
+        Recalculate all open workbooks once. Use inside suspend_excel_updates()
+        when later steps (e.g. a pivot refresh) need current formula results.
+        """
+        logger.info(f"   Recalculating workbook...")
+        self.app.api.Calculate()
+
     def clear_range(self, sheet_name: str, range_address: str) -> None:
         """
         Clear data in a specific range of a worksheet
@@ -77,12 +197,14 @@ class ExcelPortfolioAutomation:
             sheet_name: Name of the worksheet
             range_address: Range address (e.g., 'A4:AB10000')
         """
-        print(f"   Clearing range {range_address} in sheet '{sheet_name}'...")
-        sheet = self.workbook.sheets[sheet_name]
-        sheet.range(range_address).clear_contents()
-        print(f"    Range cleared successfully")
+        logger.info(f"   Clearing range {range_address} in sheet '{sheet_name}'...")
+        sheet = self._get_sheet(sheet_name)
+        with self.suspend_excel_updates():
+            sheet.range(range_address).clear_contents()
+        logger.info(f"    Range cleared successfully")
 
-    def clear_range_dynamic(self, sheet_name: str, start_cell: str, end_column: str) -> None:
+    def clear_range_dynamic(self, sheet_name: str, start_cell: str, end_column: str,
+                            end_row: int = None) -> None:
         """
         Clear data from start_cell to the last row with data in specified columns
 
@@ -90,131 +212,202 @@ class ExcelPortfolioAutomation:
             sheet_name: Name of the worksheet
             start_cell: Starting cell (e.g., 'A4', 'AX3', 'AB10')
             end_column: Last column letter (e.g., 'AB', 'AX')
+            end_row: Last row to clear; None clears to the bottom of the data block
+                     below start_cell, as end('down') finds it (default: None)
         """
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
-        # Extract column letters and row number
-        start_column = ''.join(filter(str.isalpha, start_cell))
-        start_row = int(''.join(filter(str.isdigit, start_cell)))
+        start_column, start_row = self._split_cell(start_cell)
 
-        print(f"   Analyzing range starting from {start_cell} in sheet '{sheet_name}'...")
+        if end_row is None:
+            # Bottom of the contiguous block below start_cell (end('down') from the
+            # next row), so data below a gap is left alone
+            last_row = sheet.api.Range(f'{start_column}{start_row + 1}').End(-4121).Row  # xlDown
+        else:
+            last_row = end_row
+        if last_row < start_row:
+            logger.info(f"   No data to clear in sheet '{sheet_name}'")
+            return
 
+        range_address = f"{start_cell}:{end_column}{last_row}"
+        logger.info(f"   Clearing range {range_address} in sheet '{sheet_name}'...")
         try:
-            # Find the last row with data in the start column
-            # Check from the row after start_cell
-            check_cell = sheet.range(f'{start_column}{start_row + 1}')
-            
-            # Use end('down') to find last row
-            last_row = check_cell.end('down').row
-            
-            # Handle case where end('down') goes to very last row (means no data)
-            # Check if the last_row actually has data
-            if last_row > 1048576 or last_row < start_row:
-                # No data found, just clear the start row
-                last_row = start_row
-
-            # If there's data, clear it
-            if last_row >= start_row:
-                range_address = f"{start_cell}:{end_column}{last_row}"
-                print(f"   Clearing range {range_address} in sheet '{sheet_name}'...")
-                sheet.range(range_address).clear_contents()
-                print(f"    Range cleared successfully ({last_row - start_row + 1} rows)")
-            else:
-                print(f"   No data to clear in sheet '{sheet_name}'")
-                
+            with self.suspend_excel_updates():
+                sheet.api.Range(range_address).ClearContents()
+            logger.info(f"    Range cleared successfully ({last_row - start_row + 1} rows)")
         except Exception as e:
-            print(f"   Warning: {e}")
-            # Fallback: try to clear used range
-            try:
-                used_range = sheet.used_range
-                last_row = used_range.last_cell.row
-                
-                if last_row >= start_row:
-                    range_address = f"{start_cell}:{end_column}{last_row}"
-                    print(f"   Using fallback method, clearing {range_address}...")
-                    sheet.range(range_address).clear_contents()
-                    print(f"    Range cleared successfully")
-                else:
-                    print(f"   No data to clear")
-            except Exception as e2:
-                print(f"    Could not clear range: {e2}")
+            logger.error(f"    Could not clear range: {e}")
+            raise
 
 
-    def read_csv_data(self, csv_path: str, num_columns: int = 27) -> Tuple[pd.DataFrame, int, int]:
+    def read_csv_data(self, csv_path: str, num_columns: int = 27,
+                      as_rows: bool = False) -> Tuple[pd.DataFrame, int, int]:
         """
         Read data from CSV file
 
         Args:
             csv_path: Path to the CSV file
             num_columns: Number of columns to read (default: 27 for A-AA)
+            as_rows: Return the data rows as a list of lists, streamed with the csv
+                     module, instead of a DataFrame. Blank lines are skipped, every row
+                     is padded or cut to the same width and numeric fields become
+                     int/float, so the rows can go straight to write_data_to_range
+                     without building a DataFrame (default: False)
 
         Returns:
-            Tuple of (DataFrame, num_rows, num_cols)
-        """
-        print(f"   Reading CSV file: {csv_path}")
-        df = pd.read_csv(csv_path, header=0)
+            Tuple of (DataFrame or list of rows, num_rows, num_cols)
+        """
+        logger.info(f"   Reading CSV file: {csv_path}")
+        if as_rows:
+            with open(csv_path, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                num_cols = min(len(header), num_columns)
+                # Rectangular rows (short rows padded with None, which keeps the cells
+                # blank as NaN does); empty fields become None
+                padding = [None] * num_cols
+                rows = [([self._parse_csv_value(value) for value in row[:num_cols]] + padding)[:num_cols]
+                        for row in reader if any(row)]
+
+            if len(header) < num_columns:
+                logger.info(f"   Note: CSV has only {len(header)} columns (expected {num_columns})")
+            logger.info(f"    Successfully read {len(rows)} rows and {num_cols} columns")
+            return rows, len(rows), num_cols
+
+        # Only parse the columns that are kept, with pyarrow's multi-threaded
+        # reader when it is installed
+        df = pd.read_csv(csv_path, header=0, usecols=self._csv_usecols(csv_path, num_columns),
+                         engine='pyarrow' if DTYPE_BACKEND == 'pyarrow' else 'c')
 
         # Get specified number of columns
         if len(df.columns) >= num_columns:
             df = df.iloc[:, 0:num_columns]
         else:
-            print(f"   Note: CSV has only {len(df.columns)} columns (expected {num_columns})")
+            logger.info(f"   Note: CSV has only {len(df.columns)} columns (expected {num_columns})")
 
         num_rows = len(df)
         num_cols = len(df.columns)
-        print(f"    Successfully read {num_rows} rows and {num_cols} columns")
+        logger.info(f"    Successfully read {num_rows} rows and {num_cols} columns")
 
         return df, num_rows, num_cols
 
-    def read_excel_data(self, excel_path: str, num_columns: int = 5, skip_rows: int = 0, sheet_name: str = None, engine='openpyxl') -> Tuple[pd.DataFrame, int, int]:
+    @staticmethod
+    def _parse_csv_value(value: str):
+        """
+        Type one CSV field the way the DataFrame path would: '' as None,
+        numbers as int or float, anything else as the original string.
+
+        Args:
+            value: Raw CSV field
+
+        Returns:
+            None, int, float or str
+        """
+        if value == '':
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    @staticmethod
+    def _csv_usecols(csv_path: str, num_columns: int) -> List[int]:
+        """
+        Positions of the leading num_columns columns of a CSV, bounded by its header
+        (pandas rejects usecols positions past the last column).
+
+        Args:
+            csv_path: Path to the CSV file
+            num_columns: Number of leading columns wanted
+
+        Returns:
+            List[int]: Column positions to pass as usecols
+        """
+        with open(csv_path, newline='') as f:
+            header = next(csv.reader(f), [])
+        return list(range(min(len(header), num_columns)))
+
+    def read_excel_data(self, excel_path: str, num_columns: int = 5, skip_rows: int = 0, sheet_name=0, engine: str = None) -> Tuple[pd.DataFrame, int, int]:
         """
         Read data from Excel file
 
         Args:
             excel_path: Path to the Excel file
             num_columns: Number of columns to read (default: 5 for A-E)
+            skip_rows: Rows to skip above the header row (default: 0)
+            sheet_name: Sheet name or index passed to pd.read_excel (default: 0, the
+                        first sheet; None reads every sheet, as a dict)
+            engine: pandas read engine. None uses calamine when python-calamine is
+                    installed (xlsx and xlsb), otherwise openpyxl (default: None)
 
         Returns:
             Tuple of (DataFrame, num_rows, num_cols)
         """
-        print(f"   Reading Excel file: {excel_path}")
-        df = pd.read_excel(excel_path, header=0, skiprows=skip_rows, sheet_name=sheet_name, engine=engine)
+        if engine is None:
+            engine = 'calamine' if CalamineWorkbook is not None else 'openpyxl'
+
+        logger.info(f"   Reading Excel file: {excel_path}")
+        try:
+            # Only decode the columns that are kept
+            df = pd.read_excel(excel_path, header=0, skiprows=skip_rows, sheet_name=sheet_name, engine=engine,
+                               usecols=list(range(num_columns)))
+        except ValueError:
+            # Fewer columns than num_columns; read them all and report it below
+            df = pd.read_excel(excel_path, header=0, skiprows=skip_rows, sheet_name=sheet_name, engine=engine)
 
         # Get specified number of columns
         if len(df.columns) >= num_columns:
             df = df.iloc[:, 0:num_columns]
         else:
-            print(f"   Note: Excel has only {len(df.columns)} columns (expected {num_columns})")
+            logger.info(f"   Note: Excel has only {len(df.columns)} columns (expected {num_columns})")
 
         num_rows = len(df)
         num_cols = len(df.columns)
-        print(f"    Successfully read {num_rows} rows and {num_cols} columns")
+        logger.info(f"    Successfully read {num_rows} rows and {num_cols} columns")
 
         return df, num_rows, num_cols
 
-    def write_data_to_range(self, sheet_name: str, start_cell: str, data: list) -> None:
+    def write_data_to_range(self, sheet_name: str, start_cell: str, data) -> None:
         """
         Write data to a worksheet starting at specified cell
 
         Args:
             sheet_name: Name of the worksheet
             start_cell: Starting cell (e.g., 'A4', 'B4')
-            data: List of lists containing data to write
+            data: List of lists, or a 2-D numpy array (e.g. df.to_numpy(dtype=object)),
+                  containing data to write
         """
-        if not data:
-            print(f"   No data to write to sheet '{sheet_name}'")
+        if len(data) == 0:
+            logger.info(f"   No data to write to sheet '{sheet_name}'")
             return
 
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
         num_rows = len(data)
-        num_cols = len(data[0]) if data else 0
-
-        print(f"   Writing {num_rows} rows x {num_cols} columns to sheet '{sheet_name}' starting at {start_cell}...")
+        num_cols = len(data[0])
+
+        logger.info(f"   Writing {num_rows} rows x {num_cols} columns to sheet '{sheet_name}' starting at {start_cell}...")
+
+        # Build one object block with NaN/NaT mapped to None (datetime64 as datetimes)
+        # and write it with exactly-sized Value2 assignments (WRITE_CHUNK_ROWS rows
+        # each), bypassing xlwings' per-cell value cleaning and range resizing.
+        # Lists go straight to an object array: letting numpy infer a dtype turns
+        # mixed text/number rows into strings (and NaN into 'nan')
+        if isinstance(data, np.ndarray):
+            values = data.astype('datetime64[us]') if data.dtype.kind == 'M' else data
+            values = values.astype(object)
+        else:
+            values = np.array(data, dtype=object)
+        values[pd.isna(values)] = None
 
-        # Write data to sheet
-        sheet.range(start_cell).value = data
+        start_col, start_row = self._split_cell(start_cell)
+        with self.suspend_excel_updates():
+            self._write_values2(sheet, start_row, start_col, values)
 
-        print(f"    Data written successfully")
+        logger.info(f"    Data written successfully")
 
     def fill_column_with_value(self, sheet_name: str, column: str, start_row: int,
                                 end_row: int, value: str) -> None:
@@ -228,15 +421,17 @@ class ExcelPortfolioAutomation:
             end_row: Ending row number
             value: Value to fill
         """
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
         range_address = f"{column}{start_row}:{column}{end_row}"
 
-        print(f"   Filling {range_address} with value: {value}")
-        sheet.range(range_address).value = value
-        print(f"    Column filled successfully")
+        logger.info(f"   Filling {range_address} with value: {value}")
+        with self.suspend_excel_updates():
+            sheet.range(range_address).value = value
+        logger.info(f"    Column filled successfully")
 
     def copy_formulas_to_range(self, sheet_name: str, source_range: str,
-                                target_start_row: int, target_end_row: int) -> None:
+                                target_start_row: int, target_end_row: int,
+                                first_data_row: int = 5) -> None:
         """
         Copy formulas from the last row with data in the column range to target rows
 
@@ -245,8 +440,9 @@ class ExcelPortfolioAutomation:
             source_range: Column range to search (e.g., 'F2:O2' or 'F:O')
             target_start_row: Starting row for pasting formulas
             target_end_row: Ending row for pasting formulas
+            first_data_row: First row below the headers that can hold a source formula (default: 5)
         """
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
         # Parse source range to get column range
         parts = source_range.split(':')
@@ -257,52 +453,88 @@ class ExcelPortfolioAutomation:
         end_cell = parts[1]
 
         # Extract column letters from cells
-        start_col = ''.join([c for c in start_cell if c.isalpha()])
-        end_col = ''.join([c for c in end_cell if c.isalpha()])
+        start_col, _ = self._split_cell(start_cell)
+        end_col, _ = self._split_cell(end_cell)
 
         # Find the last row with data in the start column of the range
-        last_row_with_data = sheet.range(f'{start_col}5').end('down').row
+        last_row_with_data = self._get_last_row(sheet, start_col)
+        if last_row_with_data < first_data_row:
+            # Nothing below the headers: the header row must not become the source
+            logger.warning(f"   No data rows in column {start_col} from row {first_data_row}; no formulas to copy")
+            return
 
         # Build the actual source range from the last row with data
         actual_source_range = f"{start_col}{last_row_with_data}:{end_col}{last_row_with_data}"
 
-        print(f"   Found last row with data at row {last_row_with_data}")
-        print(f"   Copying formulas from {actual_source_range} to rows {target_start_row}:{target_end_row}")
+        logger.info(f"   Found last row with data at row {last_row_with_data}")
+        logger.info(f"   Copying formulas from {actual_source_range} to rows {target_start_row}:{target_end_row}")
 
         # Copy the source range from the last row with data
         source_range_obj = sheet.range(actual_source_range)
         target_start_row = max(target_start_row, last_row_with_data + 1)  # Ensure we start below the source row
-        # Paste to each target row (starting from the row after last data row)
+        # Fill all target rows in one call (starting from the row after last data row),
+        # with relative references adjusted per row
         if target_start_row >= target_end_row:
-            print("   No rows to copy formulas to (target start row is after target end row)")
+            logger.info("   No rows to copy formulas to (target start row is after target end row)")
         else:
-            for row in range(target_start_row, target_end_row + 1):
-                target_range = f"{start_col}{row}:{end_col}{row}"
-                source_range_obj.copy(sheet.range(target_range))
+            with self.suspend_excel_updates():
+                if target_start_row == last_row_with_data + 1:
+                    # Targets continue straight below the source row: Excel's own
+                    # fill-down, no clipboard (destination includes the source row)
+                    fill_range = f"{start_col}{last_row_with_data}:{end_col}{target_end_row}"
+                    source_range_obj.api.AutoFill(Destination=sheet.range(fill_range).api, Type=1)  # xlFillCopy
+                else:
+                    # Gap below the source row: a one-row source repeats over the destination
+                    target_range = f"{start_col}{target_start_row}:{end_col}{target_end_row}"
+                    source_range_obj.api.Copy(sheet.range(target_range).api)
 
-            print(f"    Formulas copied successfully to {target_end_row - target_start_row + 1} rows")
+            logger.info(f"    Formulas copied successfully to {target_end_row - target_start_row + 1} rows")
 
-    def save_as(self, output_path: str) -> None:
+    def save_as(self, output_path: str, as_copy: bool = True) -> None:
         """
         Save workbook as a new file
 
+        By default the file is written with Workbook.SaveCopyAs, which serializes
+        a copy without re-attaching the open workbook to the new path. SaveAs is
+        used instead when as_copy is False or the output extension differs from
+        the open workbook's (SaveCopyAs cannot change the file format).
+
         Args:
             output_path: Path for the output file
+            as_copy: Save a copy and keep the original attached (default: True)
         """
-        print(f"   Saving workbook as: {output_path}")
+        logger.info(f"   Saving workbook as: {output_path}")
 
         # Get full path
         full_path = os.path.abspath(output_path)
-
-        # Save as new file
-        self.workbook.save(full_path)
-        print(f"    Workbook saved successfully")
+        same_format = (os.path.splitext(full_path)[1].lower()
+                       == os.path.splitext(self.workbook.fullname)[1].lower())
+
+        # Excel stores the current calculation mode in the file, so a save inside
+        # suspend_excel_updates() switches back to the original mode for the save
+        # (which also brings the formula results up to date)
+        resume_manual = self._suspended_calculation is not None
+        if resume_manual:
+            self.app.api.Calculation = self._suspended_calculation
+        try:
+            if as_copy and same_format:
+                self.workbook.api.SaveCopyAs(full_path)
+            else:
+                # Save as new file
+                self.workbook.save(full_path)
+        finally:
+            if resume_manual:
+                self.app.api.Calculation = -4135  # xlCalculationManual
+        logger.info(f"    Workbook saved successfully")
 
     def copy_formula_and_paste_values(self, sheet_name: str, formula_cell: str, 
                                    target_start_cell: str, find_last_row_column: str = 'A') -> None:
         """
         Copy formula from a single cell and paste to a range, then convert to values
-        Uses Excel's native PasteSpecial for better performance
+        Writes the formula to the whole range in R1C1 form (relative references
+        shift per row, as with a paste), recalculates, and freezes the results with
+        PasteSpecial(xlPasteValues) so error results stay real error values.
+        The source cell's formats are not copied
         
         Args:
             sheet_name: Name of the worksheet
@@ -310,38 +542,41 @@ class ExcelPortfolioAutomation:
             target_start_cell: Starting cell for pasting (e.g., 'A4')
             find_last_row_column: Column to check for last row with data (default: 'A')
         """
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
         
-        # Find the last row with data in the specified column
-        last_row = sheet.range(f'{find_last_row_column}4').end('down').row
+        # Find the last row with data in the specified column (xlUp lookup)
+        last_row = self._get_last_row(sheet, find_last_row_column)
         
         # Extract column letter from target_start_cell
-        target_col = ''.join([c for c in target_start_cell if c.isalpha()])
-        target_row = int(''.join([c for c in target_start_cell if c.isdigit()]))
+        target_col, target_row = self._split_cell(target_start_cell)
+        if last_row < target_row:
+            logger.info(f"   No rows to fill below {target_start_cell} in sheet '{sheet_name}'")
+            return
         
         # Build target range
         target_range = f"{target_col}{target_row}:{target_col}{last_row}"
         
-        print(f"   Copying formula from {formula_cell} to {target_range} in sheet '{sheet_name}'...")
+        logger.info(f"   Copying formula from {formula_cell} to {target_range} in sheet '{sheet_name}'...")
         
         # Copy formula to range
         formula_source = sheet.range(formula_cell)
         target_range_obj = sheet.range(target_range)
-        formula_source.copy(target_range_obj)
-        
-        print(f"   Converting formulas to values in {target_range}...")
+        with self.suspend_excel_updates():
+            target_range_obj.api.FormulaR1C1 = formula_source.api.FormulaR1C1
+
+            logger.info(f"   Converting formulas to values in {target_range}...")
+
+            # The written formulas must be evaluated before they are frozen into values.
+            # Application.Calculate also recalculates dirty precedents under manual
+            # calculation, which Range.Calculate does not
+            self.app.api.Calculate()
+            # PasteSpecial keeps #N/A, #DIV/0! etc. as errors; Value2 = Value2 would
+            # write them back as their integer codes
+            target_range_obj.api.Copy()
+            target_range_obj.api.PasteSpecial(Paste=-4163)  # xlPasteValues
+            self.app.api.CutCopyMode = False
         
-        # Convert to values using Excel's native method
-        # Copy the range
-        target_range_obj.api.Copy()
-        
-        # Paste as values using Excel constant (xlPasteValues = -4163)
-        target_range_obj.api.PasteSpecial(Paste=-4163)
-        
-        # Clear clipboard
-        self.app.api.CutCopyMode = False
-        
-        print(f"    Formula copied and converted to values successfully")
+        logger.info(f"    Formula copied and converted to values successfully")
 
     def refresh_pivot_table(self, sheet_name: str, pivot_table_name: str) -> None:
         """
@@ -352,9 +587,9 @@ class ExcelPortfolioAutomation:
             pivot_table_name: Name of the pivot table to refresh
         """
         try:
-            print(f"   Refreshing pivot table '{pivot_table_name}' in sheet '{sheet_name}'...")
+            logger.info(f"   Refreshing pivot table '{pivot_table_name}' in sheet '{sheet_name}'...")
 
-            sheet = self.workbook.sheets[sheet_name]
+            sheet = self._get_sheet(sheet_name)
 
             # Access the pivot table through Excel API
             pivot_table = sheet.api.PivotTables(pivot_table_name)
@@ -362,10 +597,10 @@ class ExcelPortfolioAutomation:
             # Refresh the pivot table
             pivot_table.RefreshTable()
 
-            print(f"    Pivot table '{pivot_table_name}' refreshed successfully")
+            logger.info(f"    Pivot table '{pivot_table_name}' refreshed successfully")
 
         except Exception as e:
-            print(f"    Error refreshing pivot table: {e}")
+            logger.error(f"    Error refreshing pivot table: {e}")
             raise
 
     def update_pivot_source_and_refresh(self,
@@ -373,122 +608,179 @@ class ExcelPortfolioAutomation:
                                        pivot_table_name: str,
                                        data_sheet_name: str,
                                        start_cell: str = 'A1',
-                                       end_column: str = None,
-                                       include_headers: bool = True) -> None:
+                                       end_column: str = None) -> None:
         """
-        Dynamically detect data range, update pivot table source, and refresh it
+        Point a pivot table at a named range over its data and refresh it.
+        The workbook name (pivot_src_<pivot table>) is redefined on every call from
+        start_cell, end_column and the real last data row, so new arguments and
+        blank cells in the key column are both handled. The first call binds the
+        pivot to the name; later calls only refresh, so Excel keeps a single pivot
+        cache.
 
         Args:
             sheet_name: Name of the worksheet containing the pivot table
             pivot_table_name: Name of the pivot table to update
             data_sheet_name: Name of the worksheet containing the source data
-            start_cell: Starting cell of the data range (default: 'A1')
+            start_cell: Header cell at the top-left of the data range (default: 'A1')
             end_column: Last column letter (e.g., 'Z'). If None, will auto-detect
-            include_headers: Whether to include header row in the range (default: True)
         """
         try:
-            print(f"   Updating data source for pivot table '{pivot_table_name}'...")
+            logger.info(f"   Updating data source for pivot table '{pivot_table_name}'...")
 
-            # Get the data sheet
-            data_sheet = self.workbook.sheets[data_sheet_name]
+            # Get the pivot table
+            sheet = self._get_sheet(sheet_name)
+            pivot_table = sheet.api.PivotTables(pivot_table_name)
+            source_name = 'pivot_src_' + re.sub(r'\W', '_', pivot_table_name)
 
             # Extract start column and row from start_cell
-            start_column = ''.join(filter(str.isalpha, start_cell))
-            start_row = int(''.join(filter(str.isdigit, start_cell)))
-
-            # Find the last row with data
-            # Start checking from one row below the start_cell
-            check_row = start_row + 1 if include_headers else start_row
-            last_row = data_sheet.range(f'{start_column}{check_row}').end('down').row
-
-            # Handle edge case where no data exists
-            if last_row > 1048576 or last_row < start_row:
-                last_row = start_row
-                print(f"   Warning: No data found, using only header row")
+            start_column, start_row = self._split_cell(start_cell)
+            data_sheet = self._get_sheet(data_sheet_name)
 
             # If end_column not specified, find it dynamically
             if end_column is None:
                 # Find last column with data in the header row
                 end_column_obj = data_sheet.range(f'{start_column}{start_row}').end('right')
-                end_column = end_column_obj.get_address(False, False).split(':')[0]
-                end_column = ''.join(filter(str.isalpha, end_column))
-
-            # Build the dynamic range address
-            range_address = f"{start_cell}:{end_column}{last_row}"
-            full_range_address = f"{data_sheet_name}!{range_address}"
+                end_column, _ = self._split_cell(end_column_obj.get_address(False, False).split(':')[0])
 
-            print(f"   Detected data range: {full_range_address}")
-            print(f"   Range contains {last_row - start_row + 1} rows (including headers)")
-
-            # Get the pivot table
-            sheet = self.workbook.sheets[sheet_name]
-            pivot_table = sheet.api.PivotTables(pivot_table_name)
+            # Last data row from the bottom of the sheet (xlUp), so blanks inside
+            # the key column do not drop the rows below them
+            last_row = self._get_last_row(data_sheet, start_column)
+            if last_row <= start_row:
+                last_row = start_row
+                logger.warning(f"   Warning: No data found, using only header row")
+
+            quoted_sheet = "'" + data_sheet_name.replace("'", "''") + "'"
+            refers_to = f"={quoted_sheet}!${start_column}${start_row}:${end_column}${last_row}"
+            logger.info(f"   Defining '{source_name}' {refers_to}")
+
+            # Already bound to the name: redefine it and refresh, the pivot cache
+            # re-reads the name's range
+            if self._workbook_has_name(source_name) and str(pivot_table.SourceData).endswith(source_name):
+                self.workbook.api.Names(source_name).RefersTo = refers_to
+                pivot_table.RefreshTable()
+                logger.info(f"    Pivot table '{pivot_table_name}' refreshed from '{source_name}'")
+                return
 
-            # Update the source data range
-            # Build the full workbook reference for the range
-            workbook_name = self.workbook.name
-            full_source = f"'{workbook_name}'!{full_range_address}"
+            self.workbook.api.Names.Add(Name=source_name, RefersTo=refers_to)
 
-            print(f"   Updating pivot table source to: {full_source}")
+            # ChangePivotCache rebuilds the pivot from the new cache, so no
+            # separate RefreshTable() is needed (it would aggregate a second time)
+            logger.info(f"   Updating pivot table source to: {source_name}")
             pivot_table.ChangePivotCache(
                 self.workbook.api.PivotCaches().Create(
                     SourceType=1,  # xlDatabase
-                    SourceData=full_source
+                    SourceData=source_name
                 )
             )
 
-            # Refresh the pivot table
-            pivot_table.RefreshTable()
-
-            print(f"    Pivot table '{pivot_table_name}' source updated and refreshed successfully")
+            logger.info(f"    Pivot table '{pivot_table_name}' source updated and refreshed successfully")
 
         except Exception as e:
-            print(f"    Error updating pivot table source: {e}")
+            logger.error(f"    Error updating pivot table source: {e}")
             raise
 
-    def read_sheet_range_to_dataframe(self, sheet_name: str, range_address: str = None) -> pd.DataFrame:
+    def _workbook_has_name(self, name: str) -> bool:
+        """
+        Check whether the workbook defines a name.
+
+        Args:
+            name: Workbook-scope name (e.g., 'pivot_src_PivotTable1')
+
+        Returns:
+            bool: True if the name exists
+        """
+        try:
+            self.workbook.api.Names(name)
+            return True
+        except Exception:
+            return False
+
+    def read_sheet_range_to_dataframe(self, sheet_name: str, range_address: str = None,
+                                      chunk_rows: int = 10000, raw: bool = False,
+                                      date_columns: Tuple[str, ...] = ('MONTH',)) -> pd.DataFrame:
         """
         Read data from a specific range in a sheet to a pandas DataFrame
         If range_address is None, reads the entire used range
 
+        Values come through xlwings' .value conversion (dates as datetimes) unless
+        raw is set: then they are read through Range.Value2, the date_columns
+        present are converted from serial numbers and error cells become NaN.
+        Ranges taller than chunk_rows are read in row blocks so each COM
+        transfer stays bounded (large single reads stall on Windows and
+        time out on macOS).
+
         Args:
             sheet_name: Name of the worksheet to read from
             range_address: Range to read (e.g., 'A1:Z100'). If None, reads used range
+            chunk_rows: Maximum number of rows per COM read (default: 10000)
+            raw: Read through Value2, skipping xlwings' per-cell conversion (default: False)
+            date_columns: With raw, columns holding dates to convert from serial
+                          numbers (default: ('MONTH',))
 
         Returns:
             pd.DataFrame: DataFrame containing the data from the range
         """
-        print(f"   Reading data from sheet '{sheet_name}'...")
+        logger.info(f"   Reading data from sheet '{sheet_name}'...")
 
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
         if range_address:
             # Read specific range
-            data = sheet.range(range_address).value
-            print(f"    Read range {range_address}")
+            source_range = sheet.range(range_address)
+            print_label = f"range {range_address}"
         else:
             # Read entire used range
-            used_range = sheet.used_range
-            data = used_range.value
-            range_address = used_range.address
-            print(f"    Read used range {range_address}")
+            source_range = sheet.used_range
+            print_label = f"used range {source_range.address}"
+
+        data = self._read_range_values(source_range, chunk_rows, raw=raw)
+        logger.info(f"    Read {print_label}")
 
-        # Convert to DataFrame
+        # Convert to DataFrame (first row as headers)
         if data:
-            # If data is a list of lists, convert to DataFrame
-            if isinstance(data, list) and len(data) > 0:
-                # Use first row as headers
-                df = pd.DataFrame(data[1:], columns=data[0])
-            else:
-                # Single cell value
-                df = pd.DataFrame([data])
+            df = pd.DataFrame(data[1:], columns=data[0])
+            if raw:
+                df = self._convert_serial_dates(self._mask_error_codes(df), date_columns)
 
-            print(f"    Successfully read {len(df)} rows and {len(df.columns)} columns")
+            logger.info(f"    Successfully read {len(df)} rows and {len(df.columns)} columns")
             return df
         else:
-            print(f"    No data found in range")
+            logger.info(f"    No data found in range")
             return pd.DataFrame()
 
+    def _read_range_values(self, source_range, chunk_rows: int = 10000, raw: bool = False):
+        """
+        Read the values of an xlwings Range, splitting tall ranges into row chunks.
+        With raw, Range.Value2 is read instead of xlwings' .value, skipping its
+        per-cell conversion: dates come back as serial numbers and error cells
+        as integer codes (see EXCEL_ERROR_CODES)
+
+        Args:
+            source_range: xlwings Range to read
+            chunk_rows: Maximum number of rows per COM read
+            raw: Read Range.Value2 (default: False)
+
+        Returns:
+            list: One sequence per row, also for single-row or single-cell ranges
+        """
+        num_rows = source_range.shape[0]
+
+        def read_block(block):
+            if not raw:
+                return block.options(ndim=2).value
+            values = block.api.Value2
+            # A single cell comes back as a bare value rather than a 2-D tuple
+            return list(values) if isinstance(values, tuple) else [(values,)]
+
+        if not chunk_rows or num_rows <= chunk_rows:
+            return read_block(source_range)
+
+        data = []
+        for first_row in range(0, num_rows, chunk_rows):
+            data.extend(read_block(source_range[first_row:min(first_row + chunk_rows, num_rows), :]))
+        logger.info(f"    Read {num_rows} rows in {len(range(0, num_rows, chunk_rows))} chunks")
+        return data
+
     def write_dataframe_to_sheet(self, sheet_name: str, start_cell: str, df: pd.DataFrame,
                                   include_headers: bool = True, clear_existing: bool = False) -> None:
         """
@@ -501,97 +793,115 @@ class ExcelPortfolioAutomation:
             include_headers: Whether to include column headers (default: True)
             clear_existing: Whether to clear existing data in the target range (default: False)
         """
-        print(f"   Writing DataFrame to sheet '{sheet_name}' starting at {start_cell}...")
+        logger.info(f"   Writing DataFrame to sheet '{sheet_name}' starting at {start_cell}...")
 
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
-        # Prepare data
-        if include_headers:
-            # Include headers
-            data = [df.columns.tolist()] + df.values.tolist()
-        else:
-            # Data only
-            data = df.values.tolist()
+        # Size of the block xlwings will write (header row + data rows)
+        num_rows = len(df) + (1 if include_headers else 0)
+        num_cols = len(df.columns)
+        has_data = num_rows > 0 and num_cols > 0
 
         # Calculate target range if we need to clear
-        if clear_existing and data:
-            num_rows = len(data)
-            num_cols = len(data[0]) if data else 0
-
+        if clear_existing and has_data:
             # Calculate end cell by offsetting from start cell
             end_cell = sheet.range(start_cell).offset(num_rows - 1, num_cols - 1)
             end_cell_address = end_cell.get_address(False, False)
 
             # Clear the range
             clear_range = f"{start_cell}:{end_cell_address}"
-            print(f"   Clearing existing data in range {clear_range}...")
-            sheet.range(clear_range).clear_contents()
+            logger.info(f"   Clearing existing data in range {clear_range}...")
+            with self.suspend_excel_updates():
+                sheet.range(clear_range).clear_contents()
 
-        # Write data
-        if data:
-            sheet.range(start_cell).value = data
-            print(f"    Successfully wrote {len(df)} rows and {len(df.columns)} columns")
+        # Write data - header row first, then the values as an object block
+        # (NaN/NaT as None) sent in WRITE_CHUNK_ROWS-row Value2 assignments
+        if has_data:
+            start_col, start_row = self._split_cell(start_cell)
+            with self.suspend_excel_updates():
+                if include_headers:
+                    self._write_values2(sheet, start_row, start_col, [df.columns.tolist()])
+                    start_row += 1
+                self._write_values2(sheet, start_row, start_col, df.to_numpy(dtype=object, na_value=None))
+            logger.info(f"    Successfully wrote {len(df)} rows and {len(df.columns)} columns")
         else:
-            print(f"    No data to write")
+            logger.info(f"    No data to write")
 
     def delete_rows_after_last_data(self, sheet_name: str, check_column: str = 'A',
-                                     start_row: int = 2, max_delete_rows: int = 1000000) -> None:
+                                     start_row: int = 2, max_delete_rows: int = 1000000,
+                                     delete: bool = True) -> None:
         """
         Delete all empty rows after the last row with data in a sheet
-        This helps clean up sheets that have extra empty rows extending the used range
+        This helps clean up sheets that have extra empty rows extending the used range.
+        With delete=False the tail rows are cleared (contents and formats) instead
+        and the used range is re-read so Excel shrinks it, which avoids the row
+        shifting and reference updates of EntireRow.Delete on large sheets
 
         Args:
             sheet_name: Name of the worksheet to clean up
             check_column: Column to check for last data (default: 'A')
             start_row: Row to start checking from (default: 2, to preserve headers)
-            max_delete_rows: Maximum number of rows to delete in one go (default: 1000000)
+            max_delete_rows: Maximum number of rows to remove in one go (default: 1000000)
+            delete: Delete the rows with EntireRow.Delete; False clears them instead (default: True)
         """
-        print(f"   Deleting extra rows after last data in sheet '{sheet_name}'...")
+        logger.info(f"   Deleting extra rows after last data in sheet '{sheet_name}'...")
 
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
         try:
-            # Find the last row with data in the check column
-            last_row_with_data = sheet.range(f'{check_column}{start_row}').end('down').row
+            # Find the last row with data in the check column (xlUp lookup)
+            last_row_with_data = self._get_last_row(sheet, check_column)
 
-            # Handle case where end('down') goes to the very last row
-            if last_row_with_data > 1048576 or last_row_with_data < start_row:
-                last_row_with_data = start_row
-                print(f"   No data found below row {start_row}")
+            if last_row_with_data < start_row:
+                logger.info(f"   No data found below row {start_row}")
                 return
 
-            print(f"   Last row with data: {last_row_with_data}")
+            logger.info(f"   Last row with data: {last_row_with_data}")
 
             # Find the actual used range last row
-            used_range_last_row = sheet.used_range.last_cell.row
+            used_range_last_row = self._last_cell_row(sheet)
 
             if used_range_last_row > last_row_with_data:
                 # Calculate how many rows to delete
                 rows_to_delete = min(used_range_last_row - last_row_with_data, max_delete_rows)
                 start_delete_row = last_row_with_data + 1
 
-                print(f"   Deleting {rows_to_delete} empty rows starting from row {start_delete_row}...")
+                action = 'Deleting' if delete else 'Clearing'
+                logger.info(f"   {action} {rows_to_delete} empty rows starting from row {start_delete_row}...")
 
-                # Delete the entire rows
                 end_delete_row = start_delete_row + rows_to_delete - 1
-                sheet.range(f'{start_delete_row}:{end_delete_row}').api.EntireRow.Delete()
+                tail_rows = sheet.range(f'{start_delete_row}:{end_delete_row}').api
+                with self.suspend_excel_updates():
+                    if delete:
+                        tail_rows.EntireRow.Delete()
+                    else:
+                        tail_rows.Clear()
+                        # Reading UsedRange makes Excel recompute (and shrink) it
+                        _ = sheet.api.UsedRange
 
-                print(f"    Successfully deleted {rows_to_delete} empty rows")
+                logger.info(f"    Successfully {'deleted' if delete else 'cleared'} {rows_to_delete} empty rows")
             else:
-                print(f"   No extra rows to delete (last data row matches used range)")
+                logger.info(f"   No extra rows to delete (last data row matches used range)")
 
         except Exception as e:
-            print(f"    Error deleting extra rows: {e}")
+            logger.error(f"    Error deleting extra rows: {e}")
             raise
 
-    def find_all_pivot_tables(self) -> dict:
+    def find_all_pivot_tables(self, include_details: bool = False) -> dict:
         """
         Find all pivot tables in the entire workbook
 
+        Args:
+            include_details: If True, return (name, pivot_table, source_data) tuples
+                             instead of names, so callers can reuse the COM handles
+                             and source strings without enumerating the sheets again
+                             (default: False)
+
         Returns:
             Dictionary with sheet names as keys and list of pivot table names as values
+            (or list of (name, pivot_table, source_data) tuples if include_details)
         """
-        print(f"   Searching for all pivot tables in workbook...")
+        logger.info(f"   Searching for all pivot tables in workbook...")
 
         pivot_tables_dict = {}
 
@@ -599,18 +909,28 @@ class ExcelPortfolioAutomation:
             sheet_name = sheet.name
             try:
                 pivot_tables = sheet.api.PivotTables()
-                if pivot_tables.Count > 0:
+                pivot_count = pivot_tables.Count
+                if pivot_count > 0:
                     pivot_list = []
-                    for i in range(1, pivot_tables.Count + 1):
-                        pivot_list.append(pivot_tables(i).Name)
+                    for i in range(1, pivot_count + 1):
+                        pivot_table = pivot_tables(i)
+                        if include_details:
+                            try:
+                                source_data = str(pivot_table.SourceData)
+                            except Exception:
+                                source_data = ''
+                            pivot_list.append((pivot_table.Name, pivot_table, source_data))
+                        else:
+                            pivot_list.append(pivot_table.Name)
                     pivot_tables_dict[sheet_name] = pivot_list
-                    print(f"    Found {pivot_tables.Count} pivot table(s) in sheet '{sheet_name}': {pivot_list}")
+                    pivot_names = [p[0] for p in pivot_list] if include_details else pivot_list
+                    logger.info(f"    Found {pivot_count} pivot table(s) in sheet '{sheet_name}': {pivot_names}")
             except Exception as e:
                 # Sheet might not support pivot tables
                 pass
 
         if not pivot_tables_dict:
-            print(f"    No pivot tables found in workbook")
+            logger.info(f"    No pivot tables found in workbook")
 
         return pivot_tables_dict
 
@@ -618,29 +938,150 @@ class ExcelPortfolioAutomation:
     # NEW METHODS - Moved from Main.py and made dynamic
     # =============================================================================
 
-    def read_portfolio_data(self, sheet_name: str) -> pd.DataFrame:
+    def read_portfolio_data(self, sheet_name: str, usecols: str = None,
+                            date_columns: Tuple[str, ...] = ('MONTH',)) -> pd.DataFrame:
         """
         Read portfolio data from a sheet (reads all columns as-is).
         Instance method that uses the current workbook.
 
         Args:
             sheet_name: Name of the portfolio sheet to read
+            usecols: Excel column span to read, e.g. 'A:F'. None reads every
+                     column of the used range (default: None)
+            date_columns: Columns holding dates; the raw Value2 serial numbers
+                          are converted to datetimes (default: ('MONTH',))
 
         Returns:
-            pd.DataFrame: Portfolio data with all columns
+            pd.DataFrame: Portfolio data with all columns (or the usecols span)
         """
-        sheet = self.workbook.sheets[sheet_name]
-        last_row = sheet.range('A2').end('down').row
+        logger.info(f"   Reading data from sheet '{sheet_name}'...")
+        sheet = self._get_sheet(sheet_name)
+
+        if usecols:
+            # Only pull the needed columns across COM, down to the sheet's last cell
+            first_col, _, last_col = usecols.partition(':')
+            source_range = sheet.range(f'{first_col}1:{last_col or first_col}{self._last_cell_row(sheet)}')
+        else:
+            # Read entire used range to preserve all columns
+            source_range = sheet.used_range
+        data = self._read_range_values(source_range, raw=True) if source_range.shape[0] >= 2 else []
 
-        # Handle empty sheet
-        if last_row > 1000000:
-            print(f"   {sheet_name}: Empty sheet detected")
+        # Drop trailing blank rows left in the used range by formatting
+        while len(data) > 1 and all(value is None for value in data[-1]):
+            data.pop()
+
+        # Handle empty sheet (only the header row, or nothing at all)
+        if len(data) < 2:
+            logger.info(f"   {sheet_name}: Empty sheet detected")
             return pd.DataFrame()
 
-        # Read entire used range to preserve all columns
-        df = self.read_sheet_range_to_dataframe(sheet_name, None)
+        df = pd.DataFrame(data[1:], columns=data[0])
+        df = self._convert_serial_dates(self._mask_error_codes(df), date_columns)
+        df = self._apply_portfolio_dtypes(df)
+        logger.info(f"    Successfully read {len(df)} rows and {len(df.columns)} columns")
+        return df
+
+    @staticmethod
+    def read_portfolio_data_from_file(file_path: str, sheet_name: str,
+                                      date_columns: Tuple[str, ...] = ('MONTH',),
+                                      usecols: str = None) -> pd.DataFrame:
+        """
+        Read portfolio data from a saved workbook on disk, without Excel.
+        Parses the .xlsb directly (calamine, falling back to pyxlsb), which is much
+        faster than pulling the sheet through COM when the data only needs to be read.
+
+        Args:
+            file_path: Path to the saved workbook
+            sheet_name: Name of the portfolio sheet to read
+            date_columns: Columns holding dates; serial numbers from the xlsb
+                          reader are converted to datetimes (default: ('MONTH',))
+            usecols: Excel column span to keep, e.g. 'A:F'. None keeps every column (default: None)
+
+        Returns:
+            pd.DataFrame: Portfolio data with all columns (or the usecols span)
+        """
+        logger.info(f"   Reading '{sheet_name}' from {os.path.basename(file_path)}...")
+        try:
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine=XLSB_READ_ENGINE, usecols=usecols)
+        except Exception as e:
+            if XLSB_READ_ENGINE == 'pyxlsb':
+                raise
+            # calamine is the fast path; pyxlsb is slower but reads the same files,
+            # so try it before the caller falls back to reading through Excel
+            logger.warning(f"calamine could not read '{sheet_name}' ({e}), retrying with pyxlsb")
+            df = pd.read_excel(file_path, sheet_name=sheet_name, engine='pyxlsb', usecols=usecols)
+
+        # Trailing rows that only carry formatting come back as all-NaN
+        df = df.dropna(how='all')
+
+        # xlsb stores dates as serial numbers
+        df = ExcelPortfolioAutomation._convert_serial_dates(df, date_columns)
+
+        df = ExcelPortfolioAutomation._apply_portfolio_dtypes(df)
+        logger.info(f"    Successfully read {len(df)} rows and {len(df.columns)} columns")
         return df
 
+    @staticmethod
+    def _mask_error_codes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace the integer codes a Value2 read returns for error cells
+        (#N/A, #DIV/0!, ...) with NaN.
+
+        Args:
+            df: DataFrame built from a Value2 read
+
+        Returns:
+            pd.DataFrame: df, or a masked copy when it held error cells
+        """
+        error_cells = df.isin(EXCEL_ERROR_CODES)
+        return df.mask(error_cells) if error_cells.to_numpy().any() else df
+
+    @staticmethod
+    def _convert_serial_dates(df: pd.DataFrame, date_columns: Tuple[str, ...]) -> pd.DataFrame:
+        """
+        Convert Excel serial-number date columns (Value2 reads, xlsb parsers) to
+        datetimes in place. In object columns (a date column with some text cells)
+        only the numeric entries are converted and the other values are kept.
+        Missing columns are left alone.
+
+        Args:
+            df: DataFrame to convert
+            date_columns: Names of the columns holding dates
+
+        Returns:
+            pd.DataFrame: The same DataFrame
+        """
+        for col in date_columns:
+            if col not in df.columns:
+                continue
+            if pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_datetime(df[col], unit='D', origin='1899-12-30')
+            elif df[col].dtype == object:
+                serials = pd.to_numeric(df[col], errors='coerce')
+                is_serial = serials.notna()
+                if is_serial.any():
+                    converted = df[col].copy()
+                    converted[is_serial] = pd.to_datetime(serials[is_serial], unit='D', origin='1899-12-30')
+                    df[col] = converted
+        return df
+
+    @staticmethod
+    def _apply_portfolio_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Give the portfolio text columns compact dtypes: EQT_DESC as STRING_DTYPE and
+        the low-cardinality PD_CATEGORY as category. CONTRACT_NO keeps its read dtype
+        so numeric contract numbers still match between sources.
+
+        Args:
+            df: Portfolio or summary DataFrame
+
+        Returns:
+            pd.DataFrame: DataFrame with the converted columns (others unchanged)
+        """
+        dtypes = {col: dtype for col, dtype in (('EQT_DESC', STRING_DTYPE), ('PD_CATEGORY', 'category'))
+                  if col in df.columns}
+        return df.astype(dtypes) if dtypes else df
+
     def write_portfolio_data(self, sheet_name: str, df: pd.DataFrame, 
                             columns_to_write: List[str],
                             column_positions: dict = None) -> None:
@@ -655,7 +1096,7 @@ class ExcelPortfolioAutomation:
             column_positions: Dict mapping column names to Excel columns (e.g., {'MONTH': 'A', 'CONTRACT_NO': 'B'})
                             If None, uses default mapping: A=MONTH, B=CONTRACT_NO, D=EQT_DESC, E=PD_CATEGORY, F=DPD
         """
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
         # Default column positions if not provided
         if column_positions is None:
@@ -667,29 +1108,44 @@ class ExcelPortfolioAutomation:
                 'DPD': 'F'
             }
 
-        # Clear only the specified data columns (skip formula columns)
-        last_row = sheet.range('A2').end('down').row
-        if last_row < 1000000:  # Has data
+        # Clear only the specified data columns (skip formula columns), all runs
+        # of adjacent columns in one multi-area ClearContents call
+        last_row = self._get_last_row(sheet, 'A')
+        clear_runs = self._group_column_runs(
+            [col_name for col_name in columns_to_write if col_name in column_positions], column_positions)
+        if last_row >= 2 and clear_runs:  # Has data
+            clear_areas = ','.join(f'{self._col_number_to_letter(run[0][0])}2:'
+                                   f'{self._col_number_to_letter(run[-1][0])}{last_row}'
+                                   for run in clear_runs)
             try:
-                # Clear columns A and B
-                sheet.range(f'A2:B{last_row}').clear_contents()
-                # Clear columns D, E, F (skip C which is formula)
-                sheet.range(f'D2:F{last_row}').clear_contents()
+                with self.suspend_excel_updates():
+                    sheet.api.Range(clear_areas).ClearContents()
             except:
                 pass
 
         if df.empty:
-            print(f"  {sheet_name}: No data to write")
+            logger.info(f"  {sheet_name}: No data to write")
             return
 
-        # Write each column to its specified position
+        # Group the target columns into runs of adjacent Excel columns
+        # (A:B and D:F by default) so each run goes over COM as one 2-D block
+        column_runs = self._group_column_runs(
+            [col_name for col_name in columns_to_write
+             if col_name in df.columns and col_name in column_positions], column_positions)
+
+        # Write each run to its position. Formula columns between runs (C by
+        # default) are never part of a block, so they keep their formulas; each
+        # run is one exactly-sized Value2 assignment (no xlwings resize calls)
         num_rows = len(df)
-        for col_name in columns_to_write:
-            if col_name in df.columns and col_name in column_positions:
-                excel_col = column_positions[col_name]
-                sheet.range(f'{excel_col}2').value = df[col_name].values.reshape(-1, 1).tolist()
+        with self.suspend_excel_updates():
+            for run in column_runs:
+                first_col = self._col_number_to_letter(run[0][0])
+                # Object array straight from the columns, NaN/NA mapped to None
+                # (works for extension dtypes too, which .values.reshape does not)
+                block_values = df[[col_name for _, col_name in run]].to_numpy(dtype=object, na_value=None)
+                self._write_values2(sheet, 2, first_col, block_values)
 
-        print(f"  {sheet_name}: {num_rows} rows written ({len(columns_to_write)} columns: {', '.join(columns_to_write)})")
+        logger.info(f"  {sheet_name}: {num_rows} rows written ({len(columns_to_write)} columns: {', '.join(columns_to_write)})")
 
     # =============================================================================
     # STATIC UTILITY METHODS - Date and File Operations
@@ -710,9 +1166,11 @@ class ExcelPortfolioAutomation:
         return (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def parse_month_string(month_str: str, date_format: str = '%m/%d/%Y') -> datetime:
         """
         Parse month string to datetime object.
+        Results are cached, since only a handful of distinct months are ever parsed.
 
         Args:
             month_str: Date string to parse
@@ -724,9 +1182,11 @@ class ExcelPortfolioAutomation:
         return datetime.strptime(month_str.strip(), date_format)
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def format_month_string(date: datetime, date_format: str = '%m/%d/%Y') -> str:
         """
         Format datetime to string.
+        Results are cached like parse_month_string; datetimes are hashable.
 
         Args:
             date: Datetime object to format
@@ -776,7 +1236,7 @@ class ExcelPortfolioAutomation:
         """
         with open(config_file_path, 'w') as f:
             f.write(ExcelPortfolioAutomation.format_month_string(latest_month, date_format))
-        print(f"Config updated: {ExcelPortfolioAutomation.format_month_string(latest_month, date_format)}")
+        logger.info(f"Config updated: {ExcelPortfolioAutomation.format_month_string(latest_month, date_format)}")
 
     @staticmethod
     def get_latest_file_in_folder(folder_path: str, file_pattern: str, 
@@ -801,15 +1261,119 @@ class ExcelPortfolioAutomation:
             # Sort by modification time (most recent first)
             matching_files.sort(key=os.path.getmtime, reverse=True)
             latest_file = matching_files[0]
-            print(f"Using latest file: {os.path.basename(latest_file)}")
+            logger.info(f"Using latest file: {os.path.basename(latest_file)}")
             return latest_file
         else:
             if fallback_file:
-                print(f"Using fallback file: {os.path.basename(fallback_file)}")
+                logger.info(f"Using fallback file: {os.path.basename(fallback_file)}")
                 return fallback_file
             else:
                 raise FileNotFoundError(f"No files found matching pattern: {file_pattern}")
 
+    @staticmethod
+    def _read_sheet_with_header_search(file_path: str, sheet_name: str, header_names,
+                                       start_row: int = 0,
+                                       max_search_rows: int = 10) -> Tuple[pd.DataFrame, Optional[int]]:
+        """
+        Read a sheet once and promote the first row containing a known header to column names.
+        Headers match ignoring surrounding spaces and case; rows below the header that
+        are entirely empty are dropped.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Name of the sheet to read
+            header_names: Header values that identify the header row
+            start_row: First row (0-based) to search for headers (default: 0)
+            max_search_rows: Maximum rows to search for headers (default: 10)
+
+        Returns:
+            Tuple of (DataFrame, header row index or None if start_row was used as fallback)
+        """
+        if CalamineWorkbook is not None:
+            # Take the rows straight from calamine; cells are normalised the way
+            # pandas' calamine engine does (blank -> None, whole floats -> int)
+            rows = CalamineWorkbook.from_path(file_path).get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+            raw = pd.DataFrame([[ExcelPortfolioAutomation._convert_calamine_cell(value) for value in row]
+                                for row in rows])
+        else:
+            raw = pd.read_excel(file_path, sheet_name=sheet_name, header=None, engine=XLSB_READ_ENGINE)
+        header_names = {str(name).strip().upper() for name in header_names}
+
+        found_header = None
+        for row_idx in range(start_row, min(start_row + max(max_search_rows, 0), len(raw))):
+            if any(isinstance(value, str) and value.strip().upper() in header_names
+                   for value in raw.iloc[row_idx]):
+                found_header = row_idx
+                break
+
+        header_idx = found_header if found_header is not None else start_row
+        if header_idx >= len(raw):
+            return pd.DataFrame(), found_header
+
+        # Name columns the way read_excel(header=n) would: blanks -> "Unnamed: i", duplicates -> "name.k"
+        columns = []
+        seen = {}
+        for col_idx, value in enumerate(raw.iloc[header_idx].tolist()):
+            name = f"Unnamed: {col_idx}" if pd.isna(value) else value
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+
+        # Blank rows are kept in raw so row indexes match the sheet; drop them from the data
+        df = raw.iloc[header_idx + 1:].dropna(how='all').reset_index(drop=True)
+        df.columns = columns
+        return df.infer_objects(), found_header
+
+    @staticmethod
+    def _convert_calamine_cell(value):
+        """Map a raw calamine cell to the value pandas' calamine engine would return."""
+        if value == "":
+            return None
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @staticmethod
+    def _valid_value_mask(values: pd.Series, invalid_values) -> pd.Series:
+        """
+        Boolean mask of cells that hold a real value.
+        Runs as one string-dtype strip + isin pass over the column; numexpr
+        (pd.eval) cannot evaluate string comparisons, so it would not help here.
+
+        Args:
+            values: Column to check
+            invalid_values: Stripped values that count as empty (e.g., EMPTY_SUMMARY_VALUES)
+
+        Returns:
+            pd.Series: True where the cell is not null and not an invalid value
+        """
+        stripped = values.astype('string').str.strip()
+        return stripped.notna() & ~stripped.isin(invalid_values)
+
+    @staticmethod
+    def _scan_folder(folder_path: str, file_pattern: str) -> List[str]:
+        """
+        List files in a folder matching a wildcard pattern with one os.scandir pass.
+        scandir returns the entry type with the listing, so no extra stat call
+        is made per file.
+
+        Args:
+            folder_path: Folder to scan
+            file_pattern: Wildcard pattern to match file names (e.g., "3. Summary_*.xlsb")
+
+        Returns:
+            Sorted list of matching file paths
+        """
+        if not os.path.isdir(folder_path):
+            return []
+
+        with os.scandir(folder_path) as entries:
+            return sorted(entry.path for entry in entries
+                          if fnmatch.fnmatch(entry.name, file_pattern) and entry.is_file())
+
     @staticmethod
     def find_summary_files_by_date_range(input_folder: str, start_month: datetime, 
                                         num_months: int, file_prefix: str = "3. Summary_",
@@ -831,29 +1395,78 @@ class ExcelPortfolioAutomation:
         """
         files = []
 
+        # List the folder once and index the candidates by the date text that
+        # follows the prefix, instead of globbing the folder once per month
+        candidates = ExcelPortfolioAutomation._scan_folder(input_folder, f"{file_prefix}*{file_extension}")
+        date_indexes = {}  # date text length -> {date text: first matching path}
+
         for i in range(1, num_months + 1):
             target_date = ExcelPortfolioAutomation.add_months(start_month, i)
             # Summary files use specified date format in filename
             date_pattern = target_date.strftime(date_format_in_filename)
 
-            pattern = os.path.join(input_folder, f"{file_prefix}{date_pattern}*{file_extension}")
-            matches = glob.glob(pattern)
-
-            if matches:
-                files.append((matches[0], target_date))
-                print(f"  Found: {os.path.basename(matches[0])}")
+            index = date_indexes.get(len(date_pattern))
+            if index is None:
+                index = {}
+                for path in candidates:
+                    date_text = os.path.basename(path)[len(file_prefix):len(file_prefix) + len(date_pattern)]
+                    index.setdefault(date_text, path)
+                date_indexes[len(date_pattern)] = index
+
+            match = index.get(date_pattern)
+            if match:
+                files.append((match, target_date))
+                logger.info(f"  Found: {os.path.basename(match)}")
             else:
-                print(f"  WARNING: No file for {date_pattern}")
+                logger.warning(f"  WARNING: No file for {date_pattern}")
 
         return files
 
+    @staticmethod
+    def _run_per_file(worker, worker_args: List[tuple], max_workers: Optional[int] = None) -> list:
+        """
+        Call worker once per argument tuple, one call per file. Results come back in
+        input order, with the exception in place of the result for a call that raised.
+
+        Args:
+            worker: Module-level or static function (must be picklable)
+            worker_args: One argument tuple per file
+            max_workers: Number of worker processes (default: min(files, CPU count); 1 = sequential)
+
+        Returns:
+            list: Result or exception per argument tuple
+        """
+        if max_workers is None:
+            max_workers = min(len(worker_args), os.cpu_count() or 1)
+
+        outcomes = []
+        if max_workers <= 1 or len(worker_args) <= 1:
+            for args in worker_args:
+                try:
+                    outcomes.append(worker(*args))
+                except Exception as e:
+                    outcomes.append(e)
+            return outcomes
+
+        # Files are independent and parsed without Excel COM, so they can be
+        # read in parallel worker processes
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(worker, *args) for args in worker_args]
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    outcomes.append(e)
+        return outcomes
+
     @staticmethod
     def extract_data_from_summary_files(file_paths: List[Tuple[str, datetime]], 
                                        column_mapping: dict,
                                        output_columns: List[str],
                                        sheet_name: str = 'SUMMARY',
                                        date_format: str = '%m/%d/%Y',
-                                       max_header_search_rows: int = 10) -> pd.DataFrame:
+                                       max_header_search_rows: int = 10,
+                                       max_workers: Optional[int] = None) -> pd.DataFrame:
         """
         Extract data from summary files into a DataFrame.
 
@@ -865,67 +1478,89 @@ class ExcelPortfolioAutomation:
             sheet_name: Name of sheet to read (default: 'SUMMARY')
             date_format: Format for MONTH column (default: '%m/%d/%Y')
             max_header_search_rows: Maximum rows to search for headers (default: 10)
+            max_workers: Number of worker processes (default: min(files, CPU count); 1 = sequential)
 
         Returns:
             pd.DataFrame: Consolidated data from all summary files
         """
         all_data = []
 
-        for file_path, month_date in file_paths:
-            try:
-                print(f"  Extracting: {os.path.basename(file_path)}")
-
-                # Find correct header row
-                df = None
-                for header_row in range(max_header_search_rows):
-                    try:
-                        temp_df = pd.read_excel(file_path, sheet_name=sheet_name,
-                                               header=header_row, engine='pyxlsb')
-                        # Check if any of the source columns exist
-                        if any(col in temp_df.columns for col in column_mapping.keys()):
-                            df = temp_df
-                            break
-                    except:
-                        continue
-
-                if df is None:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name,
-                                      header=0, engine='pyxlsb')
-
-                # Map columns
-                extracted = pd.DataFrame()
-                for src_col, tgt_col in column_mapping.items():
-                    found = None
-                    for col in df.columns:
-                        if str(col).strip().upper() == src_col.upper():
-                            found = col
-                            break
-                    extracted[tgt_col] = df[found] if found else None
-
-                # Add MONTH column
-                extracted['MONTH'] = ExcelPortfolioAutomation.format_month_string(month_date, date_format)
-
-                # Filter empty rows
-                first_col = list(column_mapping.values())[0]  # Use first target column for filtering
-                extracted = extracted[extracted[first_col].notna()]
-                extracted = extracted[~extracted[first_col].astype(str).isin(['', '-', 'nan', 'None'])]
-
-                # Reorder columns
-                extracted = extracted[output_columns]
-
-                all_data.append(extracted)
-                print(f"    Rows: {len(extracted)}")
-
-            except Exception as e:
-                print(f"    ERROR: {e}")
+        worker_args = (column_mapping, output_columns, sheet_name, date_format, max_header_search_rows)
+        outcomes = ExcelPortfolioAutomation._run_per_file(
+            ExcelPortfolioAutomation._extract_summary_file,
+            [(file_path, month_date, *worker_args) for file_path, month_date in file_paths],
+            max_workers)
+
+        # Log in the parent process, in input order
+        for (file_path, _), outcome in zip(file_paths, outcomes):
+            logger.info(f"  Extracting: {os.path.basename(file_path)}")
+            if isinstance(outcome, Exception):
+                logger.error(f"    ERROR: {outcome}")
+                continue
+            all_data.append(outcome)
+            logger.info(f"    Rows: {len(outcome)}")
 
         if all_data:
-            return pd.concat(all_data, ignore_index=True)
+            extracted_df = pd.concat(all_data, ignore_index=True, copy=False)
+            if DTYPE_BACKEND:
+                # Move every column onto Arrow arrays for the downstream filters
+                extracted_df = extracted_df.convert_dtypes(dtype_backend=DTYPE_BACKEND)
+            return ExcelPortfolioAutomation._apply_portfolio_dtypes(extracted_df)
         return pd.DataFrame(columns=output_columns)
 
+    @staticmethod
+    def _extract_summary_file(file_path: str, month_date: datetime, column_mapping: dict,
+                              output_columns: List[str], sheet_name: str, date_format: str,
+                              max_header_search_rows: int) -> pd.DataFrame:
+        """
+        Read and map a single summary file (worker for extract_data_from_summary_files).
+
+        Args:
+            file_path: Path to the summary file
+            month_date: Month the file belongs to
+            column_mapping: Dict mapping source column names to target column names
+            output_columns: List of columns to include in output (in order)
+            sheet_name: Name of sheet to read
+            date_format: Format for MONTH column
+            max_header_search_rows: Maximum rows to search for headers
+
+        Returns:
+            pd.DataFrame with output_columns; raises on read errors
+        """
+        # Find correct header row (single read, header promoted in memory)
+        df, _ = ExcelPortfolioAutomation._read_sheet_with_header_search(
+            file_path, sheet_name, column_mapping.keys(),
+            start_row=0, max_search_rows=max_header_search_rows)
+
+        # Map columns
+        extracted = pd.DataFrame()
+        for src_col, tgt_col in column_mapping.items():
+            found = None
+            for col in df.columns:
+                if str(col).strip().upper() == src_col.upper():
+                    found = col
+                    break
+            extracted[tgt_col] = df[found] if found else None
+
+        # Add MONTH column
+        extracted['MONTH'] = ExcelPortfolioAutomation.format_month_string(month_date, date_format)
+
+        # Filter empty rows
+        first_col = list(column_mapping.values())[0]  # Use first target column for filtering
+        extracted = extracted.loc[ExcelPortfolioAutomation._valid_value_mask(extracted[first_col],
+                                                                            EMPTY_SUMMARY_VALUES)]
+
+        # Reorder columns and fix the text dtypes per file, so every frame
+        # reaches the concat with the same schema
+        extracted = extracted[output_columns]
+        text_columns = {col: STRING_DTYPE for col in ('EQT_DESC', 'PD_CATEGORY', 'MONTH')
+                        if col in extracted.columns}
+        return extracted.astype(text_columns, copy=False)
+
     @staticmethod
     def get_unique_months_from_dataframe(df: pd.DataFrame, month_column: str = 'MONTH',
-                                        date_format: str = '%m/%d/%Y') -> List[datetime]:
+                                        date_format: str = '%m/%d/%Y',
+                                        month_dates: pd.Series = None) -> List[datetime]:
         """
         Get sorted list of unique months from a DataFrame.
 
@@ -933,21 +1568,26 @@ class ExcelPortfolioAutomation:
             df: DataFrame containing month data
             month_column: Name of the column containing month data (default: 'MONTH')
             date_format: Format of date strings in the column (default: '%m/%d/%Y')
+            month_dates: Already parsed month column aligned with df, to skip re-parsing (default: None)
 
         Returns:
             List of unique month datetime objects in ascending order
         """
-        if df.empty or month_column not in df.columns:
-            return []
+        if month_dates is None:
+            if df.empty or month_column not in df.columns:
+                return []
+            month_dates = pd.to_datetime(df[month_column], format=date_format, errors='coerce', cache=True)
 
-        months = pd.to_datetime(df[month_column], format=date_format, errors='coerce')
-        unique_months = sorted(months.dropna().unique())
-        return [pd.Timestamp(m).to_pydatetime() for m in unique_months]
+        # Unique and sort run on the datetime64 values; the few results are
+        # converted to datetime in one call
+        unique_months = pd.DatetimeIndex(month_dates.dropna().unique()).sort_values()
+        return list(unique_months.to_pydatetime())
 
     @staticmethod
     def filter_dataframe_by_months(df: pd.DataFrame, months_to_keep: List[datetime],
                                    month_column: str = 'MONTH',
-                                   date_format: str = '%m/%d/%Y') -> pd.DataFrame:
+                                   date_format: str = '%m/%d/%Y',
+                                   month_dates: pd.Series = None) -> pd.DataFrame:
         """
         Filter DataFrame to keep only rows matching specified months.
 
@@ -956,6 +1596,8 @@ class ExcelPortfolioAutomation:
             months_to_keep: List of datetime objects representing months to keep
             month_column: Name of the month column (default: 'MONTH')
             date_format: Format of date strings in the column (default: '%m/%d/%Y')
+            month_dates: Already parsed month column aligned with df; lets callers
+                         that split one frame several times parse it only once (default: None)
 
         Returns:
             pd.DataFrame: Filtered dataframe
@@ -963,18 +1605,63 @@ class ExcelPortfolioAutomation:
         if df.empty:
             return df
 
-        df = df.copy()
-        df['_MONTH_DT'] = pd.to_datetime(df[month_column], format=date_format, errors='coerce')
+        # Parsed months are kept in a standalone Series, so the frame is neither
+        # copied nor given a temporary column
+        if month_dates is None:
+            month_dates = pd.to_datetime(df[month_column], format=date_format, errors='coerce', cache=True)
 
-        # Convert months_to_keep to timestamps for comparison
-        keep_timestamps = [pd.Timestamp(m) for m in months_to_keep]
-        filtered = df[df['_MONTH_DT'].isin(keep_timestamps)]
+        # Compare the months as int64 nanoseconds, so the membership test runs on
+        # plain integers instead of boxing a Timestamp per month (NaT never matches)
+        keep_ns = np.asarray(months_to_keep, dtype='datetime64[ns]').view('i8')
+        month_ns = month_dates.to_numpy(dtype='datetime64[ns]').view('i8')
+        return df.loc[np.isin(month_ns, keep_ns)]
 
-        return filtered.drop(columns=['_MONTH_DT'])
+    @staticmethod
+    def concat_keep_latest(frames: List[pd.DataFrame], subset: List[str],
+                           columns: List[str] = None) -> pd.DataFrame:
+        """
+        Concatenate frames keeping only the last occurrence of each key.
+        Same result as pd.concat(frames).drop_duplicates(subset, keep='last'), but the
+        duplicates are found on one packed int64 key and each frame is trimmed before
+        the concat, so the overlapping rows are never copied.
+
+        Args:
+            frames: DataFrames ordered oldest to newest
+            subset: Key columns identifying a row (e.g., ['MONTH', 'CONTRACT_NO'])
+            columns: Only keep these columns (default: None)
+
+        Returns:
+            pd.DataFrame: Combined dataframe with unique keys
+        """
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        # Factorise each key column once across all frames and pack the codes into a
+        # single int64 key; duplicated() then runs on an int64 hash table instead of
+        # hashing the key values (NaN keys get a code, matching drop_duplicates)
+        packed_key = np.zeros(sum(len(frame) for frame in frames), dtype=np.int64)
+        for col in subset:
+            codes, uniques = pd.factorize(np.concatenate([frame[col].to_numpy(dtype=object) for frame in frames]),
+                                          use_na_sentinel=False)
+            packed_key = packed_key * len(uniques) + codes
+
+        # Frames are in oldest-to-newest order, so the last occurrence over the whole
+        # key is the latest row; split the mask back per frame
+        is_latest = ~pd.Index(packed_key).duplicated(keep='last')
+        offsets = np.cumsum([0] + [len(frame) for frame in frames])
+        kept = [frame.loc[is_latest[start:end]] for frame, start, end in zip(frames, offsets[:-1], offsets[1:])]
+
+        # pd.concat resolves each column's dtype across the frames: a datetime64 column
+        # joined with an object one keeps its Timestamps, and categories and Arrow
+        # strings survive. Joining the raw arrays with np.concatenate does neither
+        combined = pd.concat(kept, ignore_index=True, copy=False)
+        return combined.reindex(columns=columns) if columns is not None else combined
 
     @staticmethod
     def consolidate_summary_files(input_folder: str, file_pattern: str = "3. Summary_*.xlsb",
-                                   sheet_name: str = "SUMMARY", header_row: int = 0) -> pd.DataFrame:
+                                   sheet_name: str = "SUMMARY", header_row: int = 0,
+                                   max_workers: int = None) -> pd.DataFrame:
         """
         Consolidate data from multiple summary Excel files into a single DataFrame
 
@@ -983,25 +1670,26 @@ class ExcelPortfolioAutomation:
             file_pattern: Pattern to match summary files (default: "3. Summary_*.xlsb")
             sheet_name: Name of the sheet to read from (default: "SUMMARY")
             header_row: Row number containing column headers (default: 0)
+            max_workers: Number of worker processes used to read the files
+                         (default: one per file, capped at CPU count; 1 reads sequentially)
 
         Returns:
             pd.DataFrame: Consolidated dataframe with columns CONTRACT_NO, EQT_DESC, PD_CATEGORY, DPD, MONTH
         """
-        print(f"   Consolidating summary files from: {input_folder}")
-        print(f"   File pattern: {file_pattern}")
-        print()
+        logger.info(f"   Consolidating summary files from: {input_folder}")
+        logger.info(f"   File pattern: {file_pattern}")
+        logger.info('')
 
         # Find all matching files
-        search_pattern = os.path.join(input_folder, file_pattern)
-        all_summary_files = sorted(glob.glob(search_pattern))
+        all_summary_files = ExcelPortfolioAutomation._scan_folder(input_folder, file_pattern)
 
         # Take only the latest 6 files
         summary_files = all_summary_files[-6:] if len(all_summary_files) >= 6 else all_summary_files
 
-        print(f"   Found {len(all_summary_files)} summary files, using latest {len(summary_files)}:")
+        logger.info(f"   Found {len(all_summary_files)} summary files, using latest {len(summary_files)}:")
         for file in summary_files:
-            print(f"     - {os.path.basename(file)}")
-        print()
+            logger.info(f"     - {os.path.basename(file)}")
+        logger.info('')
 
         # Column mapping: source column name -> target column name
         column_mapping = {
@@ -1011,85 +1699,105 @@ class ExcelPortfolioAutomation:
             'CLIENT DPD': 'DPD'
         }
 
-        consolidated_data = []
-
-        for file_path in summary_files:
-            try:
-                print(f"   Processing: {os.path.basename(file_path)}")
-
-                # Read the SUMMARY sheet using pandas (works with closed files)
-                # Try to find the correct header row
-                df = None
-                for try_header in range(header_row, min(header_row + 10, 20)):
-                    try:
-                        temp_df = pd.read_excel(file_path, sheet_name=sheet_name, header=try_header, engine='pyxlsb')
-                        # Check if this row contains the columns we're looking for
-                        if 'CONTRACT NO' in temp_df.columns or 'CONTRACT_NO' in temp_df.columns:
-                            df = temp_df
-                            if try_header != header_row:
-                                print(f"     Found headers at row {try_header} (tried starting from row {header_row})")
-                            break
-                    except:
-                        continue
-
-                if df is None:
-                    # Fall back to specified header row
-                    df = pd.read_excel(file_path, sheet_name=sheet_name, header=header_row, engine='pyxlsb')
-
-                print(f"     Read {len(df)} rows")
-                print(f"     Available columns: {list(df.columns)[:10]}...")  # Show first 10 columns only
-
-                # Select and rename the required columns
-                selected_data = pd.DataFrame()
-
-                for source_col, target_col in column_mapping.items():
-                    # Try to find the column (case-insensitive, with or without spaces)
-                    found_col = None
-                    for col in df.columns:
-                        if str(col).strip().upper() == source_col.upper():
-                            found_col = col
-                            break
-
-                    if found_col:
-                        selected_data[target_col] = df[found_col]
-                    else:
-                        print(f"     Warning: Column '{source_col}' not found in {os.path.basename(file_path)}")
-                        selected_data[target_col] = None
-
-                # Extract date from filename (e.g., "3. Summary_2025-04-30_Final_V2.xlsb" -> "04/30/2025")
-                filename = os.path.basename(file_path)
-                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', filename)
-                if date_match:
-                    year, month, day = date_match.groups()
-                    month_date = f"{month}/{day}/{year}"
-                else:
-                    month_date = "Unknown"
-
-                selected_data['MONTH'] = month_date
-                print(f"     Extracted month: {month_date}")
+        results = ExcelPortfolioAutomation._run_per_file(
+            ExcelPortfolioAutomation._consolidate_summary_file,
+            [(file_path, sheet_name, header_row, column_mapping) for file_path in summary_files],
+            max_workers)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-                consolidated_data.append(selected_data)
-                print(f"     Successfully extracted {len(selected_data)} rows with {len(selected_data.columns)} columns")
-
-            except Exception as e:
-                print(f"     Error processing {os.path.basename(file_path)}: {e}")
-                import traceback
-                traceback.print_exc()
+        consolidated_data = [df for df in results if df is not None]
 
         # Combine all dataframes
         if consolidated_data:
-            final_df = pd.concat(consolidated_data, ignore_index=True)
-            print()
-            print(f"   Consolidation complete!")
-            print(f"     Total rows: {len(final_df)}")
-            print(f"     Total columns: {len(final_df.columns)}")
-            print(f"     Columns: {list(final_df.columns)}")
+            final_df = pd.concat(consolidated_data, ignore_index=True, copy=False)
+
+            # Keep the text columns typed so downstream .str / isin work runs on
+            # string arrays instead of Python objects. CONTRACT_NO keeps its read
+            # type: casting numeric contract numbers would give '12345.0', which no
+            # longer matches the portfolio keys
+            text_columns = {col: STRING_DTYPE for col in ('EQT_DESC', 'PD_CATEGORY')
+                            if col in final_df.columns}
+            final_df = final_df.astype(text_columns)
+            if DTYPE_BACKEND:
+                final_df = final_df.convert_dtypes(dtype_backend=DTYPE_BACKEND)
+            logger.info('')
+            logger.info(f"   Consolidation complete!")
+            logger.info(f"     Total rows: {len(final_df)}")
+            logger.info(f"     Total columns: {len(final_df.columns)}")
+            logger.info(f"     Columns: {list(final_df.columns)}")
             return final_df
         else:
-            print()
-            print(f"   No data consolidated")
+            logger.info('')
+            logger.info(f"   No data consolidated")
             return pd.DataFrame()
 
+    @staticmethod
+    def _consolidate_summary_file(file_path: str, sheet_name: str, header_row: int,
+                                  column_mapping: dict) -> Optional[pd.DataFrame]:
+        """
+        Read and map a single summary file (worker for consolidate_summary_files).
+
+        Args:
+            file_path: Path to the summary file
+            sheet_name: Name of the sheet to read from
+            header_row: Row number to start searching for column headers
+            column_mapping: Dict mapping source column names to target column names
+
+        Returns:
+            pd.DataFrame with the mapped columns and MONTH, or None if the file failed
+        """
+        try:
+            logger.info(f"   Processing: {os.path.basename(file_path)}")
+
+            # Read the SUMMARY sheet using pandas (works with closed files)
+            # The sheet is parsed once; the header row is located in memory
+            df, found_header = ExcelPortfolioAutomation._read_sheet_with_header_search(
+                file_path, sheet_name, ('CONTRACT NO', 'CONTRACT_NO'),
+                start_row=header_row, max_search_rows=min(10, 20 - header_row))
+            if found_header is not None and found_header != header_row:
+                logger.info(f"     Found headers at row {found_header} (tried starting from row {header_row})")
+
+            logger.info(f"     Read {len(df)} rows")
+            logger.info(f"     Available columns: {list(df.columns)[:10]}...")  # Show first 10 columns only
+
+            # Select and rename the required columns
+            selected_data = pd.DataFrame()
+
+            for source_col, target_col in column_mapping.items():
+                # Try to find the column (case-insensitive, with or without spaces)
+                found_col = None
+                for col in df.columns:
+                    if str(col).strip().upper() == source_col.upper():
+                        found_col = col
+                        break
+
+                if found_col:
+                    selected_data[target_col] = df[found_col]
+                else:
+                    logger.warning(f"     Warning: Column '{source_col}' not found in {os.path.basename(file_path)}")
+                    selected_data[target_col] = None
+
+            # Extract date from filename (e.g., "3. Summary_2025-04-30_Final_V2.xlsb" -> "04/30/2025")
+            filename = os.path.basename(file_path)
+            date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', filename)
+            if date_match:
+                year, month, day = date_match.groups()
+                month_date = f"{month}/{day}/{year}"
+            else:
+                month_date = "Unknown"
+
+            selected_data['MONTH'] = month_date
+            logger.info(f"     Extracted month: {month_date}")
+
+            logger.info(f"     Successfully extracted {len(selected_data)} rows with {len(selected_data.columns)} columns")
+            return selected_data
+
+        except Exception as e:
+            logger.exception(f"     Error processing {os.path.basename(file_path)}: {e}")
+            return None
+
     @staticmethod
     def add_months(date: datetime, months: int) -> datetime:
         """Add months to a date, handling month-end correctly.
@@ -1141,16 +1849,16 @@ class ExcelPortfolioAutomation:
             pd.DataFrame: Pivot data with multi-index (CONTRACT_NO_NOLASTDIG, PD_CATEGORY) 
                          and date columns
         """
-        print(f"\n   Extracting pivot table from '{sheet_name}'...")
+        logger.info(f"\n   Extracting pivot table from '{sheet_name}'...")
         
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
         
         # Read the entire used range
         used_range = sheet.used_range
         data = used_range.value
         
         if not data or len(data) < 4:
-            print(f"   ERROR: No data found in sheet '{sheet_name}'")
+            logger.error(f"   ERROR: No data found in sheet '{sheet_name}'")
             return pd.DataFrame()
         
         # Find header row (row with date columns like "2024-09")
@@ -1166,10 +1874,10 @@ class ExcelPortfolioAutomation:
                     break
         
         if header_row_idx is None:
-            print(f"   ERROR: Could not find header row with date columns")
+            logger.error(f"   ERROR: Could not find header row with date columns")
             return pd.DataFrame()
         
-        print(f"   Found header row at index: {header_row_idx}")
+        logger.info(f"   Found header row at index: {header_row_idx}")
         
         # Extract headers (date columns)
         headers = ['CONTRACT_NO_NOLASTDIG', 'PD_CATEGORY']
@@ -1181,32 +1889,96 @@ class ExcelPortfolioAutomation:
             else:
                 break  # Stop at first empty column
         
-        print(f"   Found {len(date_headers)} date columns: {date_headers[:5]}...")
+        logger.info(f"   Found {len(date_headers)} date columns: {date_headers[:5]}...")
         
-        # Extract data rows (start from row after header)
-        data_rows = []
-        for row in data[header_row_idx + 1:]:
-            if row and row[0]:  # If first column has value (contract number)
-                # Take only the columns we need (up to length of headers)
-                row_data = row[:len(headers)]
-                data_rows.append(row_data)
+        # Extract data rows (start from row after header), taking only the
+        # columns we need and keeping rows whose first column has a value
+        df = pd.DataFrame([row[:len(headers)] for row in data[header_row_idx + 1:]], columns=headers)
+        df = df.loc[df['CONTRACT_NO_NOLASTDIG'].astype(bool)]
         
-        print(f"   Extracted {len(data_rows)} data rows")
-        
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)
+        logger.info(f"   Extracted {len(df)} data rows")
         
         # Filter out empty rows and pivot artifacts like (blank) and Grand Total
-        df = df[df['CONTRACT_NO_NOLASTDIG'].notna()]
-        df = df[~df['CONTRACT_NO_NOLASTDIG'].astype(str).str.strip().isin(['(blank)', 'blank', '', 'Grand Total'])]
-        df = df[df['PD_CATEGORY'].notna()]
-        df = df[~df['PD_CATEGORY'].astype(str).str.strip().isin(['(blank)', 'blank', '', 'Grand Total'])]
+        # (one combined mask, so the frame is only sliced once)
+        valid_mask = (self._valid_value_mask(df['CONTRACT_NO_NOLASTDIG'], PIVOT_ARTIFACT_VALUES)
+                      & self._valid_value_mask(df['PD_CATEGORY'], PIVOT_ARTIFACT_VALUES))
+        df = df.loc[valid_mask]
         
-        print(f"   Final DataFrame: {len(df)} rows x {len(df.columns)} columns")
-        print(f"{df.head}")
+        logger.info(f"   Final DataFrame: {len(df)} rows x {len(df.columns)} columns")
+        logger.debug("%s", df.head())
         
         return df
 
+    @staticmethod
+    def get_pivot_sidecar_path(workbook_path: str) -> str:
+        """
+        Path of the Parquet copy of a workbook's extracted pivot data.
+
+        Args:
+            workbook_path: Path to the PD workbook (e.g., '01. PD_data_..._Updated_<ts>.xlsb')
+
+        Returns:
+            str: Sidecar path next to the workbook (e.g., '..._Updated_<ts>.pivot.parquet')
+        """
+        return str(Path(workbook_path).with_suffix('.pivot.parquet'))
+
+    @staticmethod
+    def save_pivot_sidecar(pivot_df: pd.DataFrame, workbook_path: str) -> str:
+        """
+        Save extracted pivot data as a Parquet file next to its workbook, so a later
+        step can load it without opening the workbook in Excel. Needs pyarrow.
+
+        Args:
+            pivot_df: DataFrame from extract_pivot_table_to_dataframe
+            workbook_path: Path of the saved workbook the pivot was read from
+
+        Returns:
+            str: Path to the sidecar file, or None if it could not be written
+        """
+        if DTYPE_BACKEND != 'pyarrow' or pivot_df.empty:
+            return None
+
+        sidecar_path = ExcelPortfolioAutomation.get_pivot_sidecar_path(workbook_path)
+        try:
+            pivot_df.to_parquet(sidecar_path, engine='pyarrow', compression='zstd')
+        except Exception as e:
+            # e.g. a pivot column mixing numbers and text that Arrow cannot type
+            logger.warning(f"   Warning: could not save pivot sidecar ({e})")
+            if os.path.exists(sidecar_path):
+                os.remove(sidecar_path)
+            return None
+
+        logger.info(f"   Saved pivot sidecar: {os.path.basename(sidecar_path)}")
+        return sidecar_path
+
+    @staticmethod
+    def load_pivot_sidecar(workbook_path: str) -> pd.DataFrame:
+        """
+        Load the pivot data saved by save_pivot_sidecar for a workbook. The sidecar is
+        only used when it is at least as new as the workbook.
+
+        Args:
+            workbook_path: Path to the PD workbook
+
+        Returns:
+            pd.DataFrame: Pivot data, or None if there is no usable sidecar
+        """
+        sidecar_path = ExcelPortfolioAutomation.get_pivot_sidecar_path(workbook_path)
+        if DTYPE_BACKEND != 'pyarrow' or not os.path.exists(sidecar_path):
+            return None
+        if os.path.getmtime(sidecar_path) < os.path.getmtime(workbook_path):
+            logger.info(f"   Pivot sidecar is older than the workbook, ignoring it")
+            return None
+
+        try:
+            pivot_df = pd.read_parquet(sidecar_path, engine='pyarrow')
+        except Exception as e:
+            logger.warning(f"   Warning: could not read pivot sidecar ({e})")
+            return None
+
+        logger.info(f"   Loaded pivot data from {os.path.basename(sidecar_path)}")
+        return pivot_df
+
     @staticmethod
     def convert_pivot_date_to_year_month(date_str: str) -> tuple:
         """
@@ -1256,9 +2028,9 @@ class ExcelPortfolioAutomation:
             contract_col: Column letter for contract numbers (default: 'A')
             pd_category_col: Column letter for PD category (default: 'B')
         """
-        print(f"\n   Writing data to '{sheet_name}'...")
+        logger.info(f"\n   Writing data to '{sheet_name}'...")
 
-        sheet = self.workbook.sheets[sheet_name]
+        sheet = self._get_sheet(sheet_name)
 
         # Get date columns from pivot DataFrame (only YYYY-MM format columns)
         date_columns = [col for col in pivot_df.columns
@@ -1266,10 +2038,10 @@ class ExcelPortfolioAutomation:
                        and re.match(r'\d{4}-\d{2}', str(col))]
 
         if not date_columns:
-            print(f"   ERROR: No date columns found in pivot data")
+            logger.error(f"   ERROR: No date columns found in pivot data")
             return
 
-        print(f"   Date columns ({len(date_columns)}): {date_columns}")
+        logger.info(f"   Date columns ({len(date_columns)}): {date_columns}")
 
         # Parse each date column to extract year and month abbreviation
         month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
@@ -1285,24 +2057,17 @@ class ExcelPortfolioAutomation:
             year_headers.append(year)
             month_headers.append(month_names[month_num - 1])
 
-        print(f"   Year headers: {year_headers}")
-        print(f"   Month headers: {month_headers}")
+        logger.info(f"   Year headers: {year_headers}")
+        logger.info(f"   Month headers: {month_headers}")
 
         # Column C = 3 (first data column)
         first_data_col_num = 3
         last_data_col_letter = self._col_number_to_letter(first_data_col_num + len(date_columns) - 1)
 
         # Disable screen updating, auto-calculation, alerts, and events for performance
-        print(f"   Disabling screen updating and auto-calculation...")
-        self.app.screen_updating = False
-        original_calculation = self.app.api.Calculation
-        self.app.api.Calculation = -4135  # xlCalculationManual
-        self.app.api.DisplayAlerts = False
-        self.app.api.EnableEvents = False
-
-        try:
+        with self.suspend_excel_updates():
             # Step 1: Write year headers to Row 1 (C1 onwards)
-            print(f"   Writing year headers to row {year_row} (C{year_row}:{last_data_col_letter}{year_row})...")
+            logger.info(f"   Writing year headers to row {year_row} (C{year_row}:{last_data_col_letter}{year_row})...")
 
             # Clear contents first, then unmerge (avoids dialog prompts on merged cells)
             year_range = sheet.range(f'C{year_row}:{last_data_col_letter}{year_row}')
@@ -1314,7 +2079,7 @@ class ExcelPortfolioAutomation:
 
             # Write all year values at once (batch - cells are now unmerged)
             sheet.range(f'C{year_row}').value = [year_headers]
-            print(f"   Year values written")
+            logger.info(f"   Year values written")
 
             # Merge consecutive columns that share the same year
             i = 0
@@ -1327,56 +2092,64 @@ class ExcelPortfolioAutomation:
                     end_col = self._col_number_to_letter(first_data_col_num + j - 1)
                     merge_range = f'{start_col}{year_row}:{end_col}{year_row}'
                     sheet.range(merge_range).api.Merge()
-                    print(f"     Merged {merge_range} = {year_headers[i]}")
+                    logger.info(f"     Merged {merge_range} = {year_headers[i]}")
                 i = j
 
             # Step 2: Write month abbreviation headers to Row 2 (C2 onwards)
-            print(f"   Writing month headers to row {month_row} (C{month_row}:{last_data_col_letter}{month_row})...")
+            logger.info(f"   Writing month headers to row {month_row} (C{month_row}:{last_data_col_letter}{month_row})...")
             sheet.range(f'C{month_row}').value = [month_headers]
 
             # Write DC Bucket header to S2 (only S2, preserve original P2:R2 headers)
             sheet.range(f'S{month_row}').value = 'DC Bucket'
-            print(f"   DC Bucket header written to S{month_row}")
+            logger.info(f"   DC Bucket header written to S{month_row}")
 
             # Step 3: Clear existing data from data_start_row down (including formula cols P-S)
-            last_row = sheet.range(f'{contract_col}{data_start_row}').end('down').row
-            if last_row < 1000000 and last_row >= data_start_row:
+            last_row = self._get_last_row(sheet, contract_col)
+            if last_row >= data_start_row:
                 clear_range = f'{contract_col}{data_start_row}:S{last_row}'
-                print(f"   Clearing data range {clear_range}...")
+                logger.info(f"   Clearing data range {clear_range}...")
                 sheet.range(clear_range).clear_contents()
 
             if pivot_df.empty:
-                print(f"   No data to write")
+                logger.info(f"   No data to write")
                 return
 
             num_rows = len(pivot_df)
-            print(f"   Writing {num_rows} rows of data starting at row {data_start_row}...")
-
-            # Step 4: Write CONTRACT_NO_NOLASTDIG to column A
-            print(f"   Writing column A (CONTRACT_NO)...")
-            contract_values = pivot_df['CONTRACT_NO_NOLASTDIG'].values.reshape(-1, 1).tolist()
-            sheet.range(f'{contract_col}{data_start_row}').value = contract_values
+            logger.info(f"   Writing {num_rows} rows of data starting at row {data_start_row}...")
+
+            # Steps 4-6: Write CONTRACT_NO_NOLASTDIG, PD_CATEGORY and all date values
+            # as one contiguous block (A through last_data_col) in a single COM call
+            block_columns = ['CONTRACT_NO_NOLASTDIG', 'PD_CATEGORY'] + date_columns
+            contiguous = (self._col_letter_to_number(contract_col) + 1 == self._col_letter_to_number(pd_category_col)
+                          and self._col_letter_to_number(pd_category_col) + 1 == first_data_col_num)
+
+            if contiguous:
+                logger.info(f"   Writing columns {contract_col}-{last_data_col_letter} (contract, category, date values)...")
+                data_values = pivot_df[block_columns].to_numpy(dtype=object, na_value=None)
+                self._write_values2(sheet, data_start_row, contract_col, data_values)
+            else:
+                logger.info(f"   Writing column {contract_col} (CONTRACT_NO)...")
+                contract_values = pivot_df[['CONTRACT_NO_NOLASTDIG']].to_numpy(dtype=object, na_value=None)
+                self._write_values2(sheet, data_start_row, contract_col, contract_values)
 
-            # Step 5: Write PD_CATEGORY to column B
-            print(f"   Writing column B (PD_CATEGORY)...")
-            category_values = pivot_df['PD_CATEGORY'].values.reshape(-1, 1).tolist()
-            sheet.range(f'{pd_category_col}{data_start_row}').value = category_values
+                logger.info(f"   Writing column {pd_category_col} (PD_CATEGORY)...")
+                category_values = pivot_df[['PD_CATEGORY']].to_numpy(dtype=object, na_value=None)
+                self._write_values2(sheet, data_start_row, pd_category_col, category_values)
 
-            # Step 6: Write all date values at once (columns C through last_data_col)
-            print(f"   Writing columns C-{last_data_col_letter} (date values)...")
-            data_values = pivot_df[date_columns].values.tolist()
-            sheet.range(f'C{data_start_row}').value = data_values
+                logger.info(f"   Writing columns C-{last_data_col_letter} (date values)...")
+                data_values = pivot_df[date_columns].to_numpy(dtype=object, na_value=None)
+                self._write_values2(sheet, data_start_row, 'C', data_values)
 
-            print(f"   Successfully wrote {num_rows} rows x {len(date_columns) + 2} columns")
-            print(f"   Year headers: Row {year_row} (C-{last_data_col_letter})")
-            print(f"   Month headers: Row {month_row} (C-{last_data_col_letter})")
-            print(f"   Data: Rows {data_start_row}-{data_start_row + num_rows - 1} (A-{last_data_col_letter})")
+            logger.info(f"   Successfully wrote {num_rows} rows x {len(date_columns) + 2} columns")
+            logger.info(f"   Year headers: Row {year_row} (C-{last_data_col_letter})")
+            logger.info(f"   Month headers: Row {month_row} (C-{last_data_col_letter})")
+            logger.info(f"   Data: Rows {data_start_row}-{data_start_row + num_rows - 1} (A-{last_data_col_letter})")
 
             # Step 7: Write formulas to columns P, Q, R, S
             last_data_row = data_start_row + num_rows - 1
             r = data_start_row  # first formula row
             lcl = last_data_col_letter  # e.g. 'O'
-            print(f"   Writing formulas to columns P-S (rows {r}-{last_data_row})...")
+            logger.info(f"   Writing formulas to columns P-S (rows {r}-{last_data_row})...")
 
             # Set formulas in the first data row
             sheet.range(f'P{r}').formula = f'=SUM(C{r}:{lcl}{r})'
@@ -1390,17 +2163,9 @@ class ExcelPortfolioAutomation:
                 dest = sheet.range(f'P{r}:S{last_data_row}')
                 source.api.AutoFill(Destination=dest.api, Type=0)  # xlFillDefault
 
-            print(f"   Formulas written to P{r}:S{last_data_row}")
+            logger.info(f"   Formulas written to P{r}:S{last_data_row}")
 
-        finally:
-            # Re-enable screen updating, auto-calculation, alerts, and events
-            print(f"   Re-enabling screen updating and auto-calculation...")
-            self.app.api.EnableEvents = True
-            self.app.api.DisplayAlerts = True
-            self.app.api.Calculation = original_calculation
-            self.app.screen_updating = True
-
-        print(f"   Historic PD update complete!")
+        logger.info(f"   Historic PD update complete!")
     
     def _col_number_to_letter(self, col_num: int) -> str:
         """Convert column number to Excel column letter (e.g., 1->A, 27->AA)"""
@@ -1411,6 +2176,127 @@ class ExcelPortfolioAutomation:
             col_num //= 26
         return result
 
+    def _col_letter_to_number(self, col_letter: str) -> int:
+        """Convert Excel column letter to column number (e.g., A->1, AA->27)"""
+        result = 0
+        for char in col_letter.upper():
+            result = result * 26 + (ord(char) - 64)
+        return result
+
+    def _group_column_runs(self, col_names: List[str], column_positions: dict) -> List[List[Tuple[int, str]]]:
+        """
+        Group columns into runs of adjacent Excel columns.
+
+        Args:
+            col_names: DataFrame column names to place
+            column_positions: Dict mapping column names to Excel column letters
+
+        Returns:
+            List of runs, each a list of (column number, column name) in sheet order
+        """
+        runs = []
+        for col_num, col_name in sorted((self._col_letter_to_number(column_positions[name]), name)
+                                        for name in col_names):
+            if runs and col_num == runs[-1][-1][0] + 1:
+                runs[-1].append((col_num, col_name))
+            else:
+                runs.append([(col_num, col_name)])
+        return runs
+
+    def _get_sheet(self, sheet_name: str):
+        """
+        Return the xlwings Sheet for a name, looking it up in the workbook only once.
+        The cache is emptied when the workbook is closed.
+
+        Args:
+            sheet_name: Name of the worksheet
+
+        Returns:
+            xw.Sheet: The worksheet
+        """
+        sheet = self._sheet_cache.get(sheet_name)
+        if sheet is None:
+            sheet = self._sheet_cache[sheet_name] = self.workbook.sheets[sheet_name]
+        return sheet
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _split_cell(cell_address: str) -> Tuple[str, Optional[int]]:
+        """
+        Split an A1-style address into its column letters and row number.
+        Cached, since the same few addresses are parsed on every call.
+
+        Args:
+            cell_address: Cell address (e.g., 'A4', 'AB10', '$F$2' or just 'F')
+
+        Returns:
+            Tuple of (column letters in upper case, row number or None)
+        """
+        match = CELL_ADDRESS_PATTERN.fullmatch(cell_address.strip())
+        if match is None:
+            raise ValueError(f"Invalid cell address: {cell_address}")
+        column, row = match.groups()
+        return column.upper(), int(row) if row else None
+
+    def _get_last_row(self, sheet, column: str = 'A') -> int:
+        """
+        Find the last row with data in a column with a single COM call.
+        Looks up from the bottom of the sheet (xlUp), so blank cells inside
+        the data do not cut the result short the way end('down') does.
+        Not cached: pivot refreshes, recalculation and edits made outside this
+        class change the sheet too.
+
+        Args:
+            sheet: xlwings Sheet to inspect
+            column: Column letter to check (default: 'A')
+
+        Returns:
+            int: Last row with data (1 if the column is empty)
+        """
+        return sheet.api.Cells(sheet.api.Rows.Count, column).End(-4162).Row  # xlUp
+
+    def _last_cell_row(self, sheet) -> int:
+        """
+        Find the row of the sheet's last used cell with a single COM call
+        (SpecialCells(xlCellTypeLastCell)), without building the used range.
+
+        Args:
+            sheet: xlwings Sheet to inspect
+
+        Returns:
+            int: Row of the last cell Excel considers used
+        """
+        return sheet.api.Cells.SpecialCells(11).Row  # xlCellTypeLastCell
+
+    def _write_values2(self, sheet, start_row: int, start_col: str, values,
+                       chunk_rows: int = WRITE_CHUNK_ROWS) -> None:
+        """
+        Write a 2-D block to a sheet through exactly-sized Range.Value2
+        assignments of at most chunk_rows rows each, so Excel never has to
+        allocate one SAFEARRAY for a whole large portfolio.
+
+        Args:
+            sheet: xlwings Sheet to write to
+            start_row: First row of the target range
+            start_col: First column letter of the target range
+            values: List of row lists or 2-D object ndarray (NaN must already be
+                    replaced by None); ndarrays are converted one chunk at a time
+            chunk_rows: Maximum rows per COM assignment (default: WRITE_CHUNK_ROWS)
+        """
+        if len(values) == 0:
+            return
+
+        num_rows = len(values)
+        num_cols = len(values[0])
+        end_col = self._col_number_to_letter(self._col_letter_to_number(start_col) + num_cols - 1)
+        for offset in range(0, num_rows, chunk_rows):
+            block = values[offset:offset + chunk_rows]
+            if isinstance(block, np.ndarray):
+                block = block.tolist()
+            first_row = start_row + offset
+            last_row = first_row + len(block) - 1
+            sheet.api.Range(f'{start_col}{first_row}:{end_col}{last_row}').Value2 = block
+
     def setup_historic_pivot_tables(self, pivot_sheet_name: str, data_sheet_name: str,
                                  big_pivot_name: str, small_pivot_name: str,
                                  last_month_field: str, last_data_row: int) -> None:
@@ -1426,63 +2312,62 @@ class ExcelPortfolioAutomation:
         6. Click O4 > filter > untick (blank)
         """
         import time
-        import win32com.client
 
-        print(f"\n   Setting up pivot tables in '{pivot_sheet_name}'...")
+        logger.info(f"\n   Setting up pivot tables in '{pivot_sheet_name}'...")
 
-        pivot_sheet = self.workbook.sheets[pivot_sheet_name]
+        pivot_sheet = self._get_sheet(pivot_sheet_name)
         source_range = f"'{data_sheet_name}'!$A$2:$S${last_data_row}"
 
         try:
             # ====================================================================
             # Step 1: Delete Select PD Category slicer
             # ====================================================================
-            print(f"   Step 1: Deleting existing slicers...")
+            logger.info(f"   Step 1: Deleting existing slicers...")
             try:
                 while self.workbook.api.SlicerCaches.Count > 0:
                     self.workbook.api.SlicerCaches(1).Delete()
-                print(f"     Slicers deleted")
+                logger.info(f"     Slicers deleted")
             except Exception as e:
-                print(f"     No slicers to delete: {e}")
+                logger.info(f"     No slicers to delete: {e}")
 
             # ====================================================================
             # Step 2: Select E4 (PivotTable2) and change data source
             # ====================================================================
-            print(f"   Step 2: Selecting E4 ({big_pivot_name}) > Change Data Source...")
+            logger.info(f"   Step 2: Selecting E4 ({big_pivot_name}) > Change Data Source...")
             pivot_sheet.range("E4").select()
             big_pt = pivot_sheet.api.PivotTables(big_pivot_name)
             new_cache_big = self.workbook.api.PivotCaches().Create(
                 SourceType=1, SourceData=source_range
             )
             big_pt.ChangePivotCache(new_cache_big)
-            print(f"     {big_pivot_name} source updated to {source_range}")
+            logger.info(f"     {big_pivot_name} source updated to {source_range}")
 
             # ====================================================================
-            # Step 3: Select O4 (PivotTable1) and change data source
+            # Step 3: Select O4 (PivotTable1) and point it at the same cache
+            #         (both pivots use the same source range, so one cache is
+            #         built and aggregated once instead of twice)
             # ====================================================================
-            print(f"   Step 3: Selecting O4 ({small_pivot_name}) > Change Data Source...")
+            logger.info(f"   Step 3: Selecting O4 ({small_pivot_name}) > Change Data Source...")
             pivot_sheet.range("O4").select()
             small_pt = pivot_sheet.api.PivotTables(small_pivot_name)
-            new_cache_small = self.workbook.api.PivotCaches().Create(
-                SourceType=1, SourceData=source_range
-            )
-            small_pt.ChangePivotCache(new_cache_small)
-            print(f"     {small_pivot_name} source updated to {source_range}")
+            small_pt.CacheIndex = big_pt.CacheIndex
+            logger.info(f"     {small_pivot_name} source updated to {source_range} (shared cache)")
 
             # ====================================================================
-            # Step 4: Refresh PivotTable2 then PivotTable1
+            # Step 4: Refresh the shared cache (updates PivotTable2 and PivotTable1)
             # ====================================================================
-            print(f"   Step 4: Refreshing pivots...")
+            logger.info(f"   Step 4: Refreshing pivots...")
             self.refresh_pivot_table(pivot_sheet_name, big_pivot_name)
-            self.refresh_pivot_table(pivot_sheet_name, small_pivot_name)
-            print(f"     Both pivots refreshed")
+            logger.info(f"     Both pivots refreshed")
 
             # ====================================================================
-            # Use win32com directly for Steps 5-6
-            # (bypasses xlwings COMRetryMethodWrapper that blocks PivotFields)
+            # Use the raw pywin32 worksheet for Steps 5-6 (unwrapping xlwings'
+            # COM retry wrapper, which blocks PivotFields). Taken from this
+            # workbook's own sheet: a hidden automation instance is not in the
+            # Running Object Table, so GetActiveObject would fail or attach to
+            # the user's Excel instead
             # ====================================================================
-            excel_com = win32com.client.GetActiveObject("Excel.Application")
-            ws_com = excel_com.ActiveWorkbook.Worksheets(pivot_sheet_name)
+            ws_com = getattr(pivot_sheet.api, '_inner', pivot_sheet.api)
             small_pt_com = ws_com.PivotTables(small_pivot_name)
 
             def _get_field(pt, name):
@@ -1501,18 +2386,16 @@ class ExcelPortfolioAutomation:
             # Step 5: Select O4 (PivotTable1) > Field List > drag last month
             #         (e.g. Sep2) to Rows area, then wait 3 seconds
             # ====================================================================
-            print(f"   Step 5: Adding '{last_month_field}' to {small_pivot_name} Rows...")
+            logger.info(f"   Step 5: Adding '{last_month_field}' to {small_pivot_name} Rows...")
             pivot_sheet.range("O4").select()
             field = _get_field(small_pt_com, last_month_field)
             try:
                 field.Orientation = 1  # xlRowField
-                print(f"     '{last_month_field}' added to Rows")
+                logger.info(f"     '{last_month_field}' added to Rows")
             except Exception as e:
-                print(f"     Error adding field: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     Error adding field: {e}")
 
-            print(f"     Waiting 3 seconds...")
+            logger.info(f"     Waiting 3 seconds...")
             time.sleep(3)
 
             # ====================================================================
@@ -1523,91 +2406,83 @@ class ExcelPortfolioAutomation:
             #   6d. Untick (blank), hit OK
             #   6e. Drag Sep2 from Filters → back to Rows
             # ====================================================================
-            print(f"   Step 6: Filtering (blank) via Filters on {small_pivot_name}...")
+            logger.info(f"   Step 6: Filtering (blank) via Filters on {small_pivot_name}...")
 
             # 6a. Click O4
             pivot_sheet.range("O4").select()
             time.sleep(1)
 
             # 6b. Move Sep2 from Rows to Filters (Page field)
-            print(f"     Moving '{last_month_field}' from Rows to Filters...")
+            logger.info(f"     Moving '{last_month_field}' from Rows to Filters...")
             try:
                 field.Orientation = 3  # xlPageField (Filters area)
-                print(f"     '{last_month_field}' moved to Filters")
+                logger.info(f"     '{last_month_field}' moved to Filters")
             except Exception as e:
-                print(f"     Error moving to Filters: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     Error moving to Filters: {e}")
             time.sleep(1)
 
             # 6c. Click P2 (filter dropdown) and enable Select Multiple Items
-            print(f"     Enabling Select Multiple Items...")
+            logger.info(f"     Enabling Select Multiple Items...")
             pivot_sheet.range("P2").select()
             try:
                 field.EnableMultiplePageItems = True
-                print(f"     Select Multiple Items enabled")
+                logger.info(f"     Select Multiple Items enabled")
             except Exception as e:
-                print(f"     Error enabling multi-select: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     Error enabling multi-select: {e}")
             time.sleep(1)
 
             # 6d. Untick (blank) from items: 1, 2, 3, 4, 5, (blank)
-            print(f"     Unticking (blank)...")
+            logger.info(f"     Unticking (blank)...")
             try:
                 try:
                     pi_items = field.PivotItems()
                 except TypeError:
                     pi_items = field.PivotItems
                 item_count = pi_items.Count
-                print(f"     '{last_month_field}' has {item_count} items")
+                logger.info(f"     '{last_month_field}' has {item_count} items")
 
                 blank_hidden = False
                 for i in range(1, item_count + 1):
                     try:
                         pi = _get_item(pi_items, i)
                         name = str(pi.Name)
-                        print(f"       Item {i}: '{name}'")
+                        logger.info(f"       Item {i}: '{name}'")
                         if name.lower() in ['(blank)', 'blank', '']:
-                            print(f"     >>> Unticked: '{name}'")
+                            logger.info(f"     >>> Unticked: '{name}'")
                             pi.Visible = False
                             blank_hidden = True
                     except Exception as e:
-                        print(f"       Error with item {i}: {e}")
+                        logger.warning(f"       Error with item {i}: {e}")
 
                 # Fallback: blank is typically the last item
                 if not blank_hidden and item_count > 1:
                     try:
                         pi = _get_item(pi_items, item_count)
-                        print(f"     >>> FALLBACK: Unticking item {item_count} '{pi.Name}'")
+                        logger.info(f"     >>> FALLBACK: Unticking item {item_count} '{pi.Name}'")
                         pi.Visible = False
                     except Exception as e:
-                        print(f"     Fallback failed: {e}")
+                        logger.warning(f"     Fallback failed: {e}")
 
-                print(f"     (blank) unticked")
+                logger.info(f"     (blank) unticked")
 
             except Exception as e:
-                print(f"     ERROR unticking (blank): {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     ERROR unticking (blank): {e}")
             time.sleep(1)
 
             # 6e. Move Sep2 from Filters back to Rows
-            print(f"     Moving '{last_month_field}' from Filters back to Rows...")
+            logger.info(f"     Moving '{last_month_field}' from Filters back to Rows...")
             try:
                 field.Orientation = 1  # xlRowField
-                print(f"     '{last_month_field}' back in Rows")
+                logger.info(f"     '{last_month_field}' back in Rows")
             except Exception as e:
-                print(f"     Error moving back to Rows: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     Error moving back to Rows: {e}")
             time.sleep(1)
 
             # ====================================================================
             # Step 7: Click big pivot > Insert Slicer > tick PD_CATEGORY
             #         Move slicer next to big pivot
             # ====================================================================
-            print(f"   Step 7: Adding PD_CATEGORY slicer to {big_pivot_name}...")
+            logger.info(f"   Step 7: Adding PD_CATEGORY slicer to {big_pivot_name}...")
             pivot_sheet.range("E4").select()
             try:
                 slicer_cache = self.workbook.api.SlicerCaches.Add2(big_pt, "PD_CATEGORY")
@@ -1621,20 +2496,16 @@ class ExcelPortfolioAutomation:
                 slicer.Left = big_pt_range.Left + big_pt_range.Width + 10
                 slicer.Top = big_pt_range.Top
 
-                print(f"     PD_CATEGORY slicer added next to {big_pivot_name}")
+                logger.info(f"     PD_CATEGORY slicer added next to {big_pivot_name}")
 
             except Exception as e:
-                print(f"     ERROR adding slicer: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"     ERROR adding slicer: {e}")
 
         except Exception as e:
-            print(f"\n   FATAL ERROR: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("FATAL ERROR: %s", e)
             raise
 
-        print(f"\n   Pivot setup complete!")
+        logger.info(f"\n   Pivot setup complete!")
 
     @staticmethod
     def copy_pivot_to_historic(latest_pd_file: str,
@@ -1642,7 +2513,8 @@ class ExcelPortfolioAutomation:
                               output_folder: str,
                               historic_filename: str = "02. Historic PD Calculation 2024-25.xlsb",
                               pivot_sheet: str = "01.Pivoted_Portfolio",
-                              historic_sheet: str = "02.Working") -> str:
+                              historic_sheet: str = "02.Working",
+                              visible: bool = False) -> str:
         """
         Complete workflow to copy pivot data to historic PD format.
         
@@ -1653,71 +2525,85 @@ class ExcelPortfolioAutomation:
             historic_filename: Name of the historic file (default: "02. Historic PD Calculation 2024-25.xlsb")
             pivot_sheet: Sheet name with pivot data (default: "01.Pivoted_Portfolio")
             historic_sheet: Sheet name to write historic format (default: "02.Working")
+            visible: Whether to show Excel while it runs (default: False)
         
         Returns:
             str: Path to the saved historic file
         """
-        print("\n" + "="*80)
-        print("COPYING PIVOT TO HISTORIC PD FORMAT")
-        print("="*80)
+        logger.info("\n" + "="*80)
+        logger.info("COPYING PIVOT TO HISTORIC PD FORMAT")
+        logger.info("="*80)
         
         historic_input_file = os.path.join(input_folder, historic_filename)
         
-        # Step 1: Extract pivot data from latest PD file
-        print(f"\n1. Opening PD file to extract pivot...")
-        print(f"   File: {os.path.basename(latest_pd_file)}")
-        
-        with ExcelPortfolioAutomation(latest_pd_file, visible=True) as excel:
-            pivot_df = excel.extract_pivot_table_to_dataframe(pivot_sheet)
-            
+        # Both workbooks are handled in one Excel instance instead of starting
+        # (and quitting) Excel once per file
+        app = xw.App(visible=visible)
+        try:
+            # Step 1: Extract pivot data from latest PD file. The roll-forward saves it
+            # as a Parquet sidecar, which skips opening the PD file in Excel
+            logger.info(f"\n1. Opening PD file to extract pivot...")
+            logger.info(f"   File: {os.path.basename(latest_pd_file)}")
+
+            pivot_df = ExcelPortfolioAutomation.load_pivot_sidecar(latest_pd_file)
+            if pivot_df is None:
+                # Only read from the PD file here, so skip write access and link updates
+                with ExcelPortfolioAutomation(latest_pd_file, visible=visible, read_only=True,
+                                              update_links=False, app=app) as excel:
+                    pivot_df = excel.extract_pivot_table_to_dataframe(pivot_sheet)
+
             if pivot_df.empty:
-                print("\n   ERROR: No pivot data extracted!")
+                logger.error("\n   ERROR: No pivot data extracted!")
                 return None
         
-        print(f"   Extracted pivot data: {len(pivot_df)} rows")
+            logger.info(f"   Extracted pivot data: {len(pivot_df)} rows")
         
-        # Step 2: Open historic file and write data
-        print(f"\n2. Opening Historic PD file...")
-        print(f"   File: {os.path.basename(historic_input_file)}")
+            # Step 2: Open historic file and write data
+            logger.info(f"\n2. Opening Historic PD file...")
+            logger.info(f"   File: {os.path.basename(historic_input_file)}")
         
-        with ExcelPortfolioAutomation(historic_input_file, visible=True) as excel:
-            # Write in historic format
-            excel.write_historic_pd_format(historic_sheet, pivot_df)
-
-            # Step 3: Set up pivot tables in 03.PD_Pivot
-            print(f"\n3. Setting up pivot tables...")
-
-            # Compute last month field name from pivot date columns
-            date_columns = [col for col in pivot_df.columns
-                           if col not in ['CONTRACT_NO_NOLASTDIG', 'PD_CATEGORY']
-                           and re.match(r'\d{4}-\d{2}', str(col))]
-            last_date = date_columns[-1]  # e.g., '2025-09'
-            month_num = int(last_date.split('-')[1])
-            month_names_list = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            last_month_field = f"{month_names_list[month_num - 1]}2"  # e.g., 'Sep2'
-            last_data_row = 3 + len(pivot_df) - 1  # data starts at row 3
-
-            excel.setup_historic_pivot_tables(
-                pivot_sheet_name="03.PD_Pivot",
-                data_sheet_name=historic_sheet,
-                big_pivot_name="PivotTable2",
-                small_pivot_name="PivotTable1",
-                last_month_field=last_month_field,
-                last_data_row=last_data_row
-            )
+            with ExcelPortfolioAutomation(historic_input_file, visible=visible, app=app) as excel:
+                # Write in historic format
+                excel.write_historic_pd_format(historic_sheet, pivot_df)
+
+                # Step 3: Set up pivot tables in 03.PD_Pivot
+                logger.info(f"\n3. Setting up pivot tables...")
+
+                # Compute last month field name from pivot date columns
+                date_columns = [col for col in pivot_df.columns
+                               if col not in ['CONTRACT_NO_NOLASTDIG', 'PD_CATEGORY']
+                               and re.match(r'\d{4}-\d{2}', str(col))]
+                last_date = date_columns[-1]  # e.g., '2025-09'
+                month_num = int(last_date.split('-')[1])
+                month_names_list = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+                last_month_field = f"{month_names_list[month_num - 1]}2"  # e.g., 'Sep2'
+                last_data_row = 3 + len(pivot_df) - 1  # data starts at row 3
+
+                excel.setup_historic_pivot_tables(
+                    pivot_sheet_name="03.PD_Pivot",
+                    data_sheet_name=historic_sheet,
+                    big_pivot_name="PivotTable2",
+                    small_pivot_name="PivotTable1",
+                    last_month_field=last_month_field,
+                    last_data_row=last_data_row
+                )
 
-            # Save as new file with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = historic_filename.replace(".xlsb", f"_Updated_{timestamp}.xlsb")
-            output_file = os.path.join(output_folder, output_filename)
+                # Save as new file with timestamp
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                output_dir = Path(output_folder)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                output_file = str(output_dir / historic_filename.replace(".xlsb", f"_Updated_{timestamp}.xlsb"))
 
-            excel.save_as(output_file)
-            print(f"\n4. Saved Historic file:")
-            print(f"   {output_file}")
+                excel.save_as(output_file)
+                logger.info(f"\n4. Saved Historic file:")
+                logger.info(f"   {output_file}")
         
-        print("\n" + "="*80)
-        print("HISTORIC PD UPDATE COMPLETED!")
-        print("="*80)
+        finally:
+            app.quit()
+
+        logger.info("\n" + "="*80)
+        logger.info("HISTORIC PD UPDATE COMPLETED!")
+        logger.info("="*80)
         
         return output_file
\ No newline at end of file
@@ -0,0 +1,89 @@
+"""
+Tests for the Excel-free parts of ExcelPortfolioAutomation.
+Run from the repository root with: python -m pytest -q tests
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pd = pytest.importorskip('pandas')
+pytest.importorskip('xlwings')
+
+# Same import path PD.py uses
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'Scripts', 'Class'))
+
+from BasicExcelFunctionsClass import ExcelPortfolioAutomation
+
+
+class RecordingSheet:
+    """Stands in for an xlwings Sheet, recording each api.Range(...).Value2 write."""
+
+    def __init__(self, name):
+        self.name = name
+        self.writes = {}
+        self.api = SimpleNamespace(Range=self._range)
+
+    def _range(self, address):
+        sheet = self
+
+        class _Range:
+            @property
+            def Value2(self):
+                return sheet.writes[address]
+
+            @Value2.setter
+            def Value2(self, value):
+                sheet.writes[address] = value
+
+        return _Range()
+
+
+def make_automation(sheet):
+    excel = ExcelPortfolioAutomation('unused.xlsb')
+    excel.app = SimpleNamespace(screen_updating=True,
+                                api=SimpleNamespace(Calculation=-4105, DisplayAlerts=True, EnableEvents=True))
+    excel.workbook = SimpleNamespace(sheets={sheet.name: sheet})
+    return excel
+
+
+def test_concat_keep_latest_keeps_datetimes_next_to_object_months():
+    portfolio = pd.DataFrame({
+        'MONTH': pd.to_datetime(['2025-01-31', '2025-02-28']),
+        'CONTRACT_NO': ['A1', 'A2'],
+    })
+    summary = pd.DataFrame({
+        'MONTH': ['03/31/2025'],
+        'CONTRACT_NO': ['A3'],
+    })
+
+    combined = ExcelPortfolioAutomation.concat_keep_latest(
+        [portfolio, summary], subset=['MONTH', 'CONTRACT_NO'], columns=['MONTH', 'CONTRACT_NO'])
+
+    assert combined['MONTH'].tolist() == [pd.Timestamp('2025-01-31'), pd.Timestamp('2025-02-28'), '03/31/2025']
+    parsed = pd.to_datetime(combined['MONTH'], format='%m/%d/%Y', errors='coerce')
+    assert parsed.notna().all()
+
+
+def test_write_data_to_range_keeps_mixed_list_types():
+    sheet = RecordingSheet('Portfolio')
+    excel = make_automation(sheet)
+
+    excel.write_data_to_range('Portfolio', 'B4', [['A1', 1.5, None], ['A2', float('nan'), 3.0]])
+
+    assert sheet.writes == {'B4:D5': [['A1', 1.5, None], ['A2', None, 3.0]]}
+
+
+def test_read_csv_rows_write_as_a_rectangular_block(tmp_path):
+    csv_path = tmp_path / 'portfolio.csv'
+    csv_path.write_text('CONTRACT,AMOUNT,DPD\nA1,10.5,3\n\nA2,7\nA3,,1\n')
+    sheet = RecordingSheet('Portfolio')
+    excel = make_automation(sheet)
+
+    rows, num_rows, num_cols = excel.read_csv_data(str(csv_path), num_columns=3, as_rows=True)
+    excel.write_data_to_range('Portfolio', 'B4', rows)
+
+    assert (num_rows, num_cols) == (3, 3)
+    assert sheet.writes == {'B4:D6': [['A1', 10.5, 3], ['A2', 7, None], ['A3', None, 1]]}